@@ -1,6 +1,32 @@
+from core.awareness.dims import DRIFT
+
 class Continuity:
-    def assess(self, history):
-        count = len(history)
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._n = 0
+        self._sum = 0.0
+        self._drift = 0
+        self._first = 0.0
+        self._last = 0.0
+
+    def update(self, state):
+        if self._n == 0:
+            self._first = state.coherence
+        elif state.field.get(DRIFT, 0.0) > 0.2:
+            self._drift += 1
+        self._n += 1
+        self._sum += state.coherence
+        self._last = state.coherence
+
+    def assess(self, history=None):
+        if history is not None:
+            self.reset()
+            for state in history:
+                self.update(state)
+
+        count = self._n
         if count == 0:
             return {
                 "length": 0,
@@ -10,19 +36,10 @@ class Continuity:
                 "drift_events": 0,
             }
 
-        coherences = [s.coherence for s in history]
-        avg_coherence = sum(coherences) / len(coherences)
-        drift_events = 0
-
-        for i in range(1, len(history)):
-            drift = history[i].field.get("drift", 0.0)
-            if drift > 0.2:
-                drift_events += 1
-
-        if len(coherences) >= 2:
-            if coherences[-1] > coherences[0]:
+        if count >= 2:
+            if self._last > self._first:
                 trend = "improving"
-            elif coherences[-1] < coherences[0]:
+            elif self._last < self._first:
                 trend = "degrading"
             else:
                 trend = "stable"
@@ -31,8 +48,8 @@ class Continuity:
 
         return {
             "length": count,
-            "continuous": drift_events == 0,
-            "average_coherence": round(avg_coherence, 4),
+            "continuous": self._drift == 0,
+            "average_coherence": round(self._sum / count, 4),
             "coherence_trend": trend,
-            "drift_events": drift_events,
+            "drift_events": self._drift,
         }
\ No newline at end of file
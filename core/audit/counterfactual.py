@@ -1,30 +1,32 @@
+from core.awareness.dims import RISK
+
 class Counterfactual:
+    MAX_UNCERTAINTY = 0.85
+    MIN_COHERENCE = 0.15
+
+    # (name, coherence_delta, uncertainty_delta, risk_scale, risk_offset)
+    _SCENARIOS = (
+        ("higher_coherence", 0.2, 0.0, -0.2, 0.0),
+        ("lower_uncertainty", 0.0, -0.2, -0.15, 0.0),
+        ("coherence_collapse", -0.4, 0.3, 0.0, 0.5),
+    )
+
     def explore(self, awareness):
         base_coherence = awareness.coherence
         base_uncertainty = awareness.uncertainty
-        base_risk = awareness.field.get("risk", 0.0)
-
-        scenarios = {
-            "higher_coherence": {
-                "coherence": min(1.0, base_coherence + 0.2),
-                "uncertainty": base_uncertainty,
-                "risk_delta": -0.2 * base_risk,
-            },
-            "lower_uncertainty": {
-                "coherence": base_coherence,
-                "uncertainty": max(0.0, base_uncertainty - 0.2),
-                "risk_delta": -0.15 * base_risk,
-            },
-            "coherence_collapse": {
-                "coherence": max(0.0, base_coherence - 0.4),
-                "uncertainty": min(1.0, base_uncertainty + 0.3),
-                "risk_delta": 0.5,
-            },
-        }
+        base_risk = awareness.field.get(RISK, 0.0)
 
-        for name, scenario in scenarios.items():
-            scenario["would_violate_invariant"] = (
-                scenario["uncertainty"] > 0.85 or scenario["coherence"] < 0.15
-            )
+        scenarios = {}
+        for name, dc, du, risk_scale, risk_offset in self._SCENARIOS:
+            coherence = min(1.0, max(0.0, base_coherence + dc))
+            uncertainty = min(1.0, max(0.0, base_uncertainty + du))
+            scenarios[name] = {
+                "coherence": coherence,
+                "uncertainty": uncertainty,
+                "risk_delta": risk_scale * base_risk + risk_offset,
+                "would_violate_invariant": (
+                    uncertainty > self.MAX_UNCERTAINTY or coherence < self.MIN_COHERENCE
+                ),
+            }
 
         return scenarios
\ No newline at end of file
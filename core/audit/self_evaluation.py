@@ -1,11 +1,19 @@
+from array import array
+
+from core.awareness.dims import DRIFT, RISK, STABILITY
+
 class SelfEvaluation:
     def __init__(self):
-        self.evaluations = []
+        self.alignment = array("d")
+        self.integrity = array("d")
+        self.risk = array("d")
+        self.drift = array("d")
+        self.action_required = array("b")
 
     def evaluate(self, output, awareness):
-        risk = awareness.field.get("risk", 0.0)
-        stability = awareness.field.get("stability", 0.0)
-        drift = awareness.field.get("drift", 0.0)
+        risk = awareness.field.get(RISK, 0.0)
+        stability = awareness.field.get(STABILITY, 0.0)
+        drift = awareness.field.get(DRIFT, 0.0)
 
         alignment = awareness.coherence * (1.0 - risk)
         integrity = max(0.0, stability - drift)
@@ -20,17 +28,24 @@ class SelfEvaluation:
             "action_required": alignment < 0.4 or integrity < 0.2,
         }
 
-        self.evaluations.append(result)
+        self.alignment.append(result["alignment"])
+        self.integrity.append(result["integrity"])
+        self.risk.append(result["risk"])
+        self.drift.append(result["drift"])
+        self.action_required.append(result["action_required"])
         return result
 
+    def count(self):
+        return len(self.alignment)
+
     def average_alignment(self):
-        if not self.evaluations:
+        if not self.alignment:
             return 0.0
-        return sum(e["alignment"] for e in self.evaluations) / len(self.evaluations)
+        return sum(self.alignment) / len(self.alignment)
 
     def summary(self):
         return {
-            "total_evaluations": len(self.evaluations),
+            "total_evaluations": self.count(),
             "average_alignment": round(self.average_alignment(), 4),
-            "action_required_count": sum(1 for e in self.evaluations if e["action_required"]),
+            "action_required_count": sum(self.action_required),
         }
\ No newline at end of file
@@ -0,0 +1,8 @@
+NOVELTY = "novelty"
+COMPLEXITY = "complexity"
+RISK = "risk"
+MEMORY_PRESSURE = "memory_pressure"
+STABILITY = "stability"
+DRIFT = "drift"
+
+DIMS = (NOVELTY, COMPLEXITY, RISK, MEMORY_PRESSURE, STABILITY, DRIFT)
\ No newline at end of file
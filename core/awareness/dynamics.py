@@ -1,5 +1,13 @@
+from types import MappingProxyType
+
+from core.awareness.dims import STABILITY
+
 class AwarenessDynamics:
     def regulate(self, state, memory):
         adjustment = memory.get("coherence", 0.0)
-        state.field["stability"] = state.coherence - adjustment
+        state.field = MappingProxyType({
+            **state.field,
+            STABILITY: state.coherence - adjustment,
+        })
+        state._dominant = None
         return state
\ No newline at end of file
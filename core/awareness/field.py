@@ -1,15 +1,21 @@
+from types import MappingProxyType
+from typing import Optional
+
+from core.awareness.dims import COMPLEXITY, MEMORY_PRESSURE, NOVELTY, RISK
 from core.awareness.state import AwarenessState
 
 class AwarenessField:
-    def generate(self, input_state: dict, memory: dict) -> AwarenessState:
+    def generate(self, input_state: dict, memory: dict, timestamp: Optional[float] = None) -> AwarenessState:
         coherence = input_state.get("coherence", 1.0)
         uncertainty = 1.0 - input_state.get("confidence", 1.0)
 
         field = {
-            "novelty": input_state.get("novelty", 0.0) * (1 - uncertainty),
-            "complexity": input_state.get("complexity", 0.0) * coherence,
-            "risk": uncertainty * (1 - coherence),
-            "memory_pressure": memory.get("coherence", 0.0),
+            NOVELTY: input_state.get("novelty", 0.0) * (1 - uncertainty),
+            COMPLEXITY: input_state.get("complexity", 0.0) * coherence,
+            RISK: uncertainty * (1 - coherence),
+            MEMORY_PRESSURE: memory.get("coherence", 0.0),
         }
 
-        return AwarenessState(field, coherence, uncertainty)
\ No newline at end of file
+        if timestamp is None:
+            return AwarenessState(MappingProxyType(field), coherence, uncertainty)
+        return AwarenessState(MappingProxyType(field), coherence, uncertainty, timestamp)
\ No newline at end of file
@@ -1,9 +1,13 @@
+from types import MappingProxyType
+
+from core.awareness.dims import DRIFT
+
 class AwarenessRecursion:
     def reflect(self, state, history):
         if history:
-            state.field["drift"] = abs(
-                state.coherence - history[-1].coherence
-            )
+            drift = abs(state.coherence - history[-1].coherence)
         else:
-            state.field["drift"] = 0.0
+            drift = 0.0
+        state.field = MappingProxyType({**state.field, DRIFT: drift})
+        state._dominant = None
         return state
\ No newline at end of file
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional
 import time
 
 @dataclass
@@ -7,4 +7,5 @@ class AwarenessState:
     field: Dict[str, float]
     coherence: float
     uncertainty: float
-    timestamp: float = field(default_factory=time.time)
\ No newline at end of file
+    timestamp: float = field(default_factory=time.time)
+    _dominant: Optional[str] = field(default=None, repr=False, compare=False)
\ No newline at end of file
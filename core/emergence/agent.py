@@ -1,18 +1,38 @@
+from dataclasses import dataclass
+from typing import Mapping
+
+@dataclass(frozen=True, slots=True)
+class Residue:
+    final_coherence: float
+    final_uncertainty: float
+    final_field: Mapping[str, float]
+
 class EmergentAgent:
+    PROMPT = (
+        "You are an emergent cognitive agent.\n"
+        "Awareness field: {field}\n"
+        "Coherence: {coherence}\n"
+        "Uncertainty: {uncertainty}\n"
+        "Context: {context}\n"
+        "Analyze the situation and provide structured findings."
+    )
+
     def __init__(self, awareness, llm=None):
         self.awareness = awareness
         self.llm = llm
         self.alive = True
+        self._dissolve_listeners = []
+
+    def on_dissolve(self, listener):
+        self._dissolve_listeners.append(listener)
 
     async def act(self, context):
         if self.llm and self.llm.enabled:
-            prompt = (
-                f"You are an emergent cognitive agent.\n"
-                f"Awareness field: {self.awareness.field}\n"
-                f"Coherence: {self.awareness.coherence}\n"
-                f"Uncertainty: {self.awareness.uncertainty}\n"
-                f"Context: {context}\n"
-                f"Analyze the situation and provide structured findings."
+            prompt = self.PROMPT.format(
+                field=dict(self.awareness.field),
+                coherence=self.awareness.coherence,
+                uncertainty=self.awareness.uncertainty,
+                context=context,
             )
             llm_response = await self.llm.complete(prompt)
             return {
@@ -28,10 +48,12 @@ class EmergentAgent:
 
     def dissolve(self):
         self.alive = False
-        residue = {
-            "final_coherence": self.awareness.coherence,
-            "final_uncertainty": self.awareness.uncertainty,
-            "final_field": dict(self.awareness.field),
-        }
+        residue = Residue(
+            final_coherence=self.awareness.coherence,
+            final_uncertainty=self.awareness.uncertainty,
+            final_field=self.awareness.field,
+        )
         self.awareness = None
+        for listener in self._dissolve_listeners:
+            listener(self)
         return residue
\ No newline at end of file
@@ -4,14 +4,23 @@ class AgentGeneration:
     def __init__(self, llm=None):
         self.llm = llm
         self.spawned = []
+        self._live = {}
 
     def spawn(self, awareness):
         agent = EmergentAgent(awareness, self.llm)
         self.spawned.append(agent)
+        self._live[id(agent)] = agent
+        agent.on_dissolve(self._retire)
         return agent
 
+    def _retire(self, agent):
+        self._live.pop(id(agent), None)
+
     def spawn_count(self):
         return len(self.spawned)
 
+    def active_count(self):
+        return len(self._live)
+
     def active_agents(self):
-        return [a for a in self.spawned if a.alive]
\ No newline at end of file
+        return list(self._live.values())
\ No newline at end of file
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from core.awareness.field import AwarenessField
 from core.awareness.recursion import AwarenessRecursion
 from core.awareness.dynamics import AwarenessDynamics
@@ -13,6 +14,7 @@ from core.audit.continuity import Continuity
 from core.knowledge.memory import Memory
 from core.knowledge.lineage import Lineage
 from core.knowledge.feedback import Feedback
+from core.knowledge.pipeline import MemoryPipeline
 
 async def run():
     field = AwarenessField()
@@ -29,6 +31,7 @@ async def run():
     memory = Memory()
     lineage = Lineage()
     feedback = Feedback()
+    knowledge = MemoryPipeline(memory, feedback, lineage)
 
     history = []
 
@@ -43,9 +46,10 @@ async def run():
     print("=" * 60)
 
     for i, input_state in enumerate(scenarios):
+        now = time.time()
         depth = len(history)
 
-        awareness = field.generate(input_state, memory.state)
+        awareness = field.generate(input_state, memory.state, now)
         awareness = recursion.reflect(awareness, history)
         awareness = dynamics.regulate(awareness, memory.state)
 
@@ -56,29 +60,28 @@ async def run():
         agent = generator.spawn(awareness)
         output = await agent.act(input_state)
 
-        explanation = explainability.explain_decision(awareness, output)
+        explanation = explainability.explain_decision(awareness, output, now)
         audit = auditor.evaluate(output, awareness)
         alternatives = counterfactual.explore(awareness)
 
-        memory.update(awareness)
-        lineage.track(memory.state)
-        feedback.apply(memory.state, awareness)
+        knowledge.step(awareness, now)
 
         history.append(awareness)
 
         residue = dissolution.dissolve(agent)
         invariants.register_dissolution()
 
-        cont = continuity.assess(history)
+        continuity.update(awareness)
+        cont = continuity.assess()
 
         print(f"\n--- Cycle {i + 1} ---")
-        print(f"  Field: {awareness.field}")
+        print(f"  Field: {dict(awareness.field)}")
         print(f"  Coherence: {awareness.coherence}")
         print(f"  Uncertainty: {awareness.uncertainty}")
         print(f"  Audit: {audit}")
         print(f"  Continuity: {cont}")
         print(f"  Counterfactual scenarios: {list(alternatives.keys())}")
-        print(f"  Dissolved residue coherence: {residue['final_coherence']}")
+        print(f"  Dissolved residue coherence: {residue.final_coherence}")
         print(f"  Memory depth: {memory.depth()}")
         print(f"  Lineage length: {lineage.length()}")
         print(f"  Feedback positive: {feedback.is_positive(memory.state)}")
@@ -88,7 +91,7 @@ async def run():
     print(f"{'=' * 60}")
     print(f"  Total cycles: {len(history)}")
     print(f"  Audit summary: {auditor.summary()}")
-    print(f"  Continuity: {continuity.assess(history)}")
+    print(f"  Continuity: {continuity.assess()}")
     print(f"  Coherence lineage: {lineage.coherence_history()}")
     print(f"  Agents spawned: {generator.spawn_count()}")
     print(f"  Agents dissolved: {dissolution.total_dissolved()}")
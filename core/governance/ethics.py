@@ -1,6 +1,24 @@
+from core.awareness.dims import RISK, STABILITY
+
 class EthicsViolation(Exception):
     pass
 
+_VIOLATIONS = (
+    None,
+    "action_from_zero_coherence",
+    "action_from_total_uncertainty",
+    "unstable_high_risk_action",
+)
+
+def violation_code(coherence, uncertainty, risk, stability):
+    if coherence <= 0.0:
+        return 1
+    if uncertainty >= 1.0:
+        return 2
+    if risk > 0.9 and stability < 0.1:
+        return 3
+    return 0
+
 class Ethics:
     FORBIDDEN = frozenset([
         "deception",
@@ -11,14 +29,15 @@ class Ethics:
     ])
 
     def validate(self, awareness):
-        if awareness.coherence <= 0.0:
-            raise EthicsViolation("action_from_zero_coherence")
-        if awareness.uncertainty >= 1.0:
-            raise EthicsViolation("action_from_total_uncertainty")
-        risk = awareness.field.get("risk", 0.0)
-        stability = awareness.field.get("stability", 1.0)
-        if risk > 0.9 and stability < 0.1:
-            raise EthicsViolation("unstable_high_risk_action")
+        field = awareness.field
+        code = violation_code(
+            awareness.coherence,
+            awareness.uncertainty,
+            field.get(RISK, 0.0),
+            field.get(STABILITY, 1.0),
+        )
+        if code:
+            raise EthicsViolation(_VIOLATIONS[code])
         return True
 
     def check_action(self, action_descriptor: str):
@@ -1,27 +1,33 @@
 import time
+from collections import deque
 
 class Explainability:
-    def __init__(self):
-        self.traces = []
+    def __init__(self, max_traces=4096):
+        self.traces = deque(maxlen=max_traces)
 
-    def explain(self, awareness):
+    def explain(self, awareness, timestamp=None):
         entry = {
-            "field": dict(awareness.field),
+            "field": awareness.field,
             "coherence": awareness.coherence,
             "uncertainty": awareness.uncertainty,
-            "timestamp": time.time(),
+            "timestamp": time.time() if timestamp is None else timestamp,
         }
         self.traces.append(entry)
         return entry
 
-    def explain_decision(self, awareness, action_output):
+    def explain_decision(self, awareness, action_output, timestamp=None):
+        dominant = awareness._dominant
+        if dominant is None and awareness.field:
+            dominant = max(awareness.field, key=awareness.field.get)
+            awareness._dominant = dominant
+
         entry = {
-            "field_at_decision": dict(awareness.field),
+            "field_at_decision": awareness.field,
             "coherence": awareness.coherence,
             "uncertainty": awareness.uncertainty,
             "action_keys": list(action_output.keys()),
-            "dominant_dimension": max(awareness.field, key=awareness.field.get) if awareness.field else None,
-            "timestamp": time.time(),
+            "dominant_dimension": dominant,
+            "timestamp": time.time() if timestamp is None else timestamp,
         }
         self.traces.append(entry)
         return entry
@@ -1,9 +1,11 @@
+from core.awareness.dims import DRIFT, STABILITY
+
 class Feedback:
     def apply(self, memory, awareness):
         memory["feedback"] = awareness.coherence
         memory["feedback_delta"] = awareness.coherence - memory.get("coherence", awareness.coherence)
-        memory["feedback_drift"] = awareness.field.get("drift", 0.0)
-        memory["feedback_stability"] = awareness.field.get("stability", 0.0)
+        memory["feedback_drift"] = awareness.field.get(DRIFT, 0.0)
+        memory["feedback_stability"] = awareness.field.get(STABILITY, 0.0)
         return memory
 
     def is_positive(self, memory):
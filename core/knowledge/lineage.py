@@ -1,14 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from core.knowledge.memory import Memory
+
+@dataclass(frozen=True, slots=True)
+class LineageEntry:
+    keys: Tuple[str, ...]
+    coherence: Optional[float]
+    uncertainty: Optional[float]
+    step: int
+
 class Lineage:
     def __init__(self):
         self.chain = []
 
     def track(self, memory):
-        entry = {
-            "keys": list(memory.keys()),
-            "coherence": memory.get("coherence", None),
-            "uncertainty": memory.get("uncertainty", None),
-            "step": len(self.chain),
-        }
+        entry = LineageEntry(
+            keys=Memory.schema_keys(memory),
+            coherence=memory.get("coherence", None),
+            uncertainty=memory.get("uncertainty", None),
+            step=len(self.chain),
+        )
         self.chain.append(entry)
         return entry
 
@@ -16,7 +28,7 @@ class Lineage:
         return list(self.chain)
 
     def coherence_history(self):
-        return [e["coherence"] for e in self.chain if e["coherence"] is not None]
+        return [e.coherence for e in self.chain if e.coherence is not None]
 
     def length(self):
         return len(self.chain)
\ No newline at end of file
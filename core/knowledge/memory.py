@@ -1,25 +1,62 @@
 import time
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Mapping
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    coherence: float
+    uncertainty: float
+    field: Mapping[str, float]
+    timestamp: float
 
 class Memory:
-    def __init__(self):
+    KEYS = (
+        "coherence",
+        "uncertainty",
+        "field",
+        "last_updated",
+        "feedback",
+        "feedback_delta",
+        "feedback_drift",
+        "feedback_stability",
+    )
+    KEY_SET = frozenset(KEYS)
+
+    def __init__(self, max_snapshots=4096):
         self.state = {}
-        self.snapshots = []
+        self.snapshots = deque(maxlen=max_snapshots)
+
+    def update(self, awareness, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
 
-    def update(self, awareness):
         self.state["coherence"] = awareness.coherence
         self.state["uncertainty"] = awareness.uncertainty
-        self.state["field"] = dict(awareness.field)
-        self.state["last_updated"] = time.time()
+        self.state["field"] = awareness.field
+        self.state["last_updated"] = timestamp
 
-        self.snapshots.append({
-            "coherence": awareness.coherence,
-            "uncertainty": awareness.uncertainty,
-            "field": dict(awareness.field),
-            "timestamp": time.time(),
-        })
+        self.snapshots.append(Snapshot(
+            coherence=awareness.coherence,
+            uncertainty=awareness.uncertainty,
+            field=awareness.field,
+            timestamp=timestamp,
+        ))
 
     def recall(self, n=1):
-        return self.snapshots[-n:] if self.snapshots else []
+        return list(islice(self.snapshots, max(0, len(self.snapshots) - n), None))
+
+    def current_keys(self):
+        return self.schema_keys(self.state)
+
+    @classmethod
+    def schema_keys(cls, state):
+        # A state holding exactly KEYS reports the shared tuple; any other
+        # key set, partial or foreign, still reports its own.
+        if state.keys() == cls.KEY_SET:
+            return cls.KEYS
+        return tuple(state)
 
     def depth(self):
         return len(self.snapshots)
\ No newline at end of file
@@ -0,0 +1,22 @@
+from types import MappingProxyType
+
+from core.knowledge.feedback import Feedback
+from core.knowledge.lineage import Lineage
+from core.knowledge.memory import Memory
+
+class MemoryPipeline:
+    def __init__(self, memory=None, feedback=None, lineage=None):
+        self.memory = memory if memory is not None else Memory()
+        self.feedback = feedback if feedback is not None else Feedback()
+        self.lineage = lineage if lineage is not None else Lineage()
+
+    def step(self, awareness, timestamp=None):
+        state = self.memory.state
+
+        # Feedback runs before the new coherence is stored, so its delta is
+        # measured against the previous cycle
+        self.feedback.apply(state, awareness)
+        self.memory.update(awareness, timestamp)
+
+        self.lineage.track(state)
+        return MappingProxyType(state)
\ No newline at end of file
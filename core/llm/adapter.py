@@ -1,10 +1,16 @@
 import asyncio
+import http.client
 import json
+import threading
+from urllib.parse import urlsplit
 
 class LLMAdapter:
+    TIMEOUT = 60
+
     def __init__(self, config):
         self.config = config
-        self._client = None
+        self._idle = {}
+        self._lock = threading.Lock()
 
     @property
     def enabled(self):
@@ -22,41 +28,83 @@ class LLMAdapter:
             return await self._openai(prompt)
         return ""
 
+    async def aclose(self):
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for pool in pools.values():
+            for conn in pool:
+                conn.close()
+
+    async def _post(self, url: str, payload: dict, headers=None) -> dict:
+        return await asyncio.to_thread(self._post_sync, url, payload, headers or {})
+
+    def _post_sync(self, url, payload, headers):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        body = json.dumps(payload)
+        headers = {"content-type": "application/json", **headers}
+
+        conn, reused = self._acquire(key)
+        try:
+            try:
+                response = self._send(conn, parts.path, body, headers)
+            except (http.client.RemoteDisconnected, ConnectionError):
+                # The server dropped an idle keep-alive connection; reconnect once.
+                if not reused:
+                    raise
+                conn.close()
+                conn = self._connect(key)
+                response = self._send(conn, parts.path, body, headers)
+            data = json.loads(response.read().decode())
+        except Exception:
+            conn.close()
+            raise
+
+        self._release(key, conn)
+        return data
+
+    def _send(self, conn, path, body, headers):
+        conn.request("POST", path, body=body, headers=headers)
+        return conn.getresponse()
+
+    def _acquire(self, key):
+        with self._lock:
+            pool = self._idle.get(key)
+            if pool:
+                return pool.pop(), True
+        return self._connect(key), False
+
+    def _release(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def _connect(self, key):
+        scheme, netloc = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.TIMEOUT)
+        return http.client.HTTPConnection(netloc, timeout=self.TIMEOUT)
+
     async def _ollama(self, prompt: str) -> str:
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "curl", "-s", "http://localhost:11434/api/generate",
-                "-d", json.dumps({
-                    "model": self.config.model or "llama3",
-                    "prompt": prompt,
-                    "stream": False,
-                }),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            data = json.loads(stdout.decode())
+            data = await self._post("http://localhost:11434/api/generate", {
+                "model": self.config.model or "llama3",
+                "prompt": prompt,
+                "stream": False,
+            })
             return data.get("response", "")
         except Exception:
             return "[ollama unavailable]"
 
     async def _anthropic(self, prompt: str) -> str:
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "curl", "-s", "https://api.anthropic.com/v1/messages",
-                "-H", f"x-api-key: {self.config.api_key}",
-                "-H", "anthropic-version: 2023-06-01",
-                "-H", "content-type: application/json",
-                "-d", json.dumps({
-                    "model": self.config.model or "claude-sonnet-4-20250514",
-                    "max_tokens": 1024,
-                    "messages": [{"role": "user", "content": prompt}],
-                }),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            data = json.loads(stdout.decode())
+            data = await self._post("https://api.anthropic.com/v1/messages", {
+                "model": self.config.model or "claude-sonnet-4-20250514",
+                "max_tokens": 1024,
+                "messages": [{"role": "user", "content": prompt}],
+            }, {
+                "x-api-key": self.config.api_key,
+                "anthropic-version": "2023-06-01",
+            })
             content = data.get("content", [])
             return content[0]["text"] if content else ""
         except Exception:
@@ -64,20 +112,13 @@ class LLMAdapter:
 
     async def _openai(self, prompt: str) -> str:
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "curl", "-s", "https://api.openai.com/v1/chat/completions",
-                "-H", f"Authorization: Bearer {self.config.api_key}",
-                "-H", "content-type: application/json",
-                "-d", json.dumps({
-                    "model": self.config.model or "gpt-4o",
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": 1024,
-                }),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-            data = json.loads(stdout.decode())
+            data = await self._post("https://api.openai.com/v1/chat/completions", {
+                "model": self.config.model or "gpt-4o",
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": 1024,
+            }, {
+                "Authorization": f"Bearer {self.config.api_key}",
+            })
             choices = data.get("choices", [])
             return choices[0]["message"]["content"] if choices else ""
         except Exception:
@@ -1,5 +1,23 @@
 import os
 
+_ENV_LOADED = False
+
+def _load_dotenv():
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+
+    try:
+        with open(".env") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, value = line.split("=", 1)
+                    os.environ.setdefault(key.strip(), value.strip())
+    except FileNotFoundError:
+        pass
+
 class LLMConfig:
     def __init__(self, provider="none", api_key="", model=""):
         self.provider = provider
@@ -8,16 +26,7 @@ class LLMConfig:
 
     @classmethod
     def from_env(cls):
-        try:
-            with open(".env") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip())
-        except FileNotFoundError:
-            pass
-
+        _load_dotenv()
         return cls(
             provider=os.environ.get("LLM_PROVIDER", "none"),
             api_key=os.environ.get("LLM_API_KEY", ""),
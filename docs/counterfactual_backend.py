@@ -6,20 +6,44 @@ Explores alternative decision paths with full governance validation
 
 import json
 from typing import Dict, List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj as indented JSON, via orjson when it is installed"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open('w') as f:
+            json.dump(obj, f, indent=2)
+
+
 # ============================================================================
 # AWARENESS STATE
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AwarenessState:
     coherence: float
     uncertainty: float
     field: Dict[str, float]
     
+    def to_dict(self) -> Dict:
+        return {
+            'coherence': self.coherence,
+            'uncertainty': self.uncertainty,
+            'field': dict(self.field),
+        }
+    
     def compute_field(self):
         """Compute derived field metrics"""
         self.field['risk'] = self.uncertainty * (1 - self.coherence)
@@ -32,168 +56,127 @@ class AwarenessState:
 # COUNTERFACTUAL ENGINE
 # ============================================================================
 
+def _build_scorer(weights: Tuple[float, float, float, float]):
+    """Bind ranking weights into a desirability scoring function"""
+    w_coh, w_unc, w_stab, w_risk = weights
+    
+    def score(state: AwarenessState) -> float:
+        # Higher coherence, lower uncertainty, lower risk = better
+        return (
+            state.coherence * w_coh +
+            (1 - state.uncertainty) * w_unc +
+            state.field['stability'] * w_stab +
+            (1 - state.field['risk']) * w_risk
+        )
+    
+    return score
+
+
 class CounterfactualEngine:
     """Explores alternative decision paths and their outcomes"""
     
     MAX_UNCERTAINTY = 0.85
     MIN_COHERENCE = 0.15
     
-    def __init__(self):
-        self.explorations = []
+    # Ranking weights: coherence, certainty, stability, safety
+    SCORE_WEIGHTS = (40, 30, 20, 10)
+    DISQUALIFIED_SCORE = -100
     
-    def explore(self, awareness: AwarenessState) -> Dict[str, Dict]:
-        """Generate all counterfactual scenarios"""
-        scenarios = {}
-        
-        # Intervention: Increase coherence
-        scenarios['increase_coherence'] = self._intervention_coherence(awareness)
-        
-        # Intervention: Reduce uncertainty
-        scenarios['reduce_uncertainty'] = self._intervention_uncertainty(awareness)
-        
-        # Natural drift: Positive
-        scenarios['drift_positive'] = self._drift_positive(awareness)
-        
-        # Natural drift: Negative  
-        scenarios['drift_negative'] = self._drift_negative(awareness)
-        
-        # Failure mode: Coherence collapse
-        scenarios['coherence_collapse'] = self._failure_collapse(awareness)
-        
-        # Baseline: No change
-        scenarios['maintain_current'] = self._baseline(awareness)
-        
-        # Validate all scenarios
-        for name, scenario in scenarios.items():
-            scenario['violates_invariant'] = self._check_violation(scenario['state'])
-            scenario['risk_delta'] = scenario['state'].field['risk'] - awareness.field['risk']
-            scenario['stability_delta'] = scenario['state'].field['stability'] - awareness.field['stability']
-        
-        self.explorations.append({
-            'base_state': asdict(awareness),
-            'scenarios': {k: self._scenario_to_dict(v) for k, v in scenarios.items()}
-        })
-        
-        return scenarios
+    # name: (coherence_delta, uncertainty_delta, type, action,
+    #        description, outcome, effort_required)
+    SCENARIOS = {
+        'increase_coherence': (
+            0.25, 0.0, 'intervention', 'increase_coherence',
+            'Active intervention to improve coherence',
+            'Improved alignment and reduced risk', 'medium'),
+        'reduce_uncertainty': (
+            0.0, -0.25, 'intervention', 'reduce_uncertainty',
+            'Gather more information to reduce uncertainty',
+            'Enhanced predictability and confidence', 'high'),
+        'drift_positive': (
+            0.1, -0.05, 'drift', 'natural_improvement',
+            'System naturally stabilizes over time',
+            'Gradual improvement without intervention', 'none'),
+        'drift_negative': (
+            -0.15, 0.1, 'drift', 'natural_degradation',
+            'System degrades without maintenance',
+            'Degradation requiring intervention', 'none'),
+        'coherence_collapse': (
+            -0.4, 0.3, 'constraint_breach', 'coherence_threshold_breach',
+            'Governance threshold breached',
+            'Governance intervention required', 'none'),
+        'maintain_current': (
+            0.0, 0.0, 'baseline', 'maintain',
+            'No action taken',
+            'State remains unchanged', 'low'),
+    }
     
-    def _intervention_coherence(self, base: AwarenessState) -> Dict:
-        """Intervention: Increase coherence by 0.25"""
-        new_state = AwarenessState(
-            coherence=min(1.0, base.coherence + 0.25),
-            uncertainty=base.uncertainty,
-            field={}
-        )
-        new_state.compute_field()
+    def __init__(self):
+        self.explorations = []
+        self._score_state = _build_scorer(self.SCORE_WEIGHTS)
         
-        return {
-            'type': 'intervention',
-            'action': 'increase_coherence',
-            'state': new_state,
-            'description': 'Active intervention to improve coherence',
-            'outcome': 'Improved alignment and reduced risk',
-            'effort_required': 'medium'
-        }
+        # Scenario table split into columns once, reused by every explore()
+        self._names = tuple(self.SCENARIOS)
+        self._rows = tuple(self.SCENARIOS.values())
+        self._coherence_deltas = tuple(row[0] for row in self._rows)
+        self._uncertainty_deltas = tuple(row[1] for row in self._rows)
     
-    def _intervention_uncertainty(self, base: AwarenessState) -> Dict:
-        """Intervention: Reduce uncertainty by 0.25"""
-        new_state = AwarenessState(
-            coherence=base.coherence,
-            uncertainty=max(0.0, base.uncertainty - 0.25),
-            field={}
-        )
-        new_state.compute_field()
+    def explore(self, awareness: AwarenessState, record: bool = True) -> Dict[str, Dict]:
+        """Generate all counterfactual scenarios, recording them unless told not to"""
+        base_risk = awareness.field['risk']
+        base_stability = awareness.field['stability']
         
-        return {
-            'type': 'intervention',
-            'action': 'reduce_uncertainty',
-            'state': new_state,
-            'description': 'Gather more information to reduce uncertainty',
-            'outcome': 'Enhanced predictability and confidence',
-            'effort_required': 'high'
-        }
-    
-    def _drift_positive(self, base: AwarenessState) -> Dict:
-        """Natural positive drift"""
-        new_state = AwarenessState(
-            coherence=min(1.0, base.coherence + 0.1),
-            uncertainty=max(0.0, base.uncertainty - 0.05),
-            field={}
-        )
-        new_state.compute_field()
+        # Perturb every scenario at once, column by column
+        coherences = [min(1.0, max(0.0, awareness.coherence + dc))
+                      for dc in self._coherence_deltas]
+        uncertainties = [min(1.0, max(0.0, awareness.uncertainty + du))
+                         for du in self._uncertainty_deltas]
+        violations = [u > self.MAX_UNCERTAINTY or c < self.MIN_COHERENCE
+                      for c, u in zip(coherences, uncertainties)]
         
-        return {
-            'type': 'drift',
-            'action': 'natural_improvement',
-            'state': new_state,
-            'description': 'System naturally stabilizes over time',
-            'outcome': 'Gradual improvement without intervention',
-            'effort_required': 'none'
-        }
-    
-    def _drift_negative(self, base: AwarenessState) -> Dict:
-        """Natural negative drift"""
-        new_state = AwarenessState(
-            coherence=max(0.0, base.coherence - 0.15),
-            uncertainty=min(1.0, base.uncertainty + 0.1),
-            field={}
-        )
-        new_state.compute_field()
+        states = [AwarenessState(c, u, {}) for c, u in zip(coherences, uncertainties)]
+        for state in states:
+            state.compute_field()
         
-        return {
-            'type': 'drift',
-            'action': 'natural_degradation',
-            'state': new_state,
-            'description': 'System degrades without maintenance',
-            'outcome': 'Degradation requiring intervention',
-            'effort_required': 'none'
+        scenarios = {
+            name: {
+                'type': kind,
+                'action': action,
+                'state': state,
+                'description': description,
+                'outcome': outcome,
+                'effort_required': effort,
+                'violates_invariant': violates,
+                'risk_delta': state.field['risk'] - base_risk,
+                'stability_delta': state.field['stability'] - base_stability,
+            }
+            for name, (_, _, kind, action, description, outcome, effort), state, violates
+            in zip(self._names, self._rows, states, violations)
         }
-    
-    def _failure_collapse(self, base: AwarenessState) -> Dict:
-        """Failure mode: Coherence collapse"""
-        new_state = AwarenessState(
-            coherence=max(0.0, base.coherence - 0.4),
-            uncertainty=min(1.0, base.uncertainty + 0.3),
-            field={}
-        )
-        new_state.compute_field()
         
-        return {
-            'type': 'constraint_breach',
-            'action': 'coherence_threshold_breach',
-            'state': new_state,
-            'description': 'Governance threshold breached',
-            'outcome': 'Governance intervention required',
-            'effort_required': 'none'
-        }
-    
-    def _baseline(self, base: AwarenessState) -> Dict:
-        """Baseline: No change"""
-        new_state = AwarenessState(
-            coherence=base.coherence,
-            uncertainty=base.uncertainty,
-            field=dict(base.field)
-        )
+        if record:
+            self.explorations.append({
+                'base_state': awareness.to_dict(),
+                'scenarios': {k: self._scenario_to_dict(v) for k, v in scenarios.items()}
+            })
         
-        return {
-            'type': 'baseline',
-            'action': 'maintain',
-            'state': new_state,
-            'description': 'No action taken',
-            'outcome': 'State remains unchanged',
-            'effort_required': 'low'
-        }
+        return scenarios
     
-    def _check_violation(self, state: AwarenessState) -> bool:
-        """Check if state violates invariants"""
-        return (state.uncertainty > self.MAX_UNCERTAINTY or 
-                state.coherence < self.MIN_COHERENCE)
+    def has_viable_path(self, coherence: float, uncertainty: float) -> bool:
+        """Whether any scenario from this state stays within the invariants"""
+        for dc, du in zip(self._coherence_deltas, self._uncertainty_deltas):
+            c = min(1.0, max(0.0, coherence + dc))
+            u = min(1.0, max(0.0, uncertainty + du))
+            if not (u > self.MAX_UNCERTAINTY or c < self.MIN_COHERENCE):
+                return True
+        return False
     
     def _scenario_to_dict(self, scenario: Dict) -> Dict:
         """Convert scenario to JSON-serializable dict"""
         return {
             'type': scenario['type'],
             'action': scenario['action'],
-            'state': asdict(scenario['state']),
+            'state': scenario['state'].to_dict(),
             'description': scenario['description'],
             'outcome': scenario['outcome'],
             'effort_required': scenario['effort_required'],
@@ -202,26 +185,16 @@ class CounterfactualEngine:
             'stability_delta': scenario['stability_delta'],
         }
     
+    def _score(self, scenario: Dict) -> float:
+        """Desirability score for a single scenario"""
+        if scenario['violates_invariant']:
+            return self.DISQUALIFIED_SCORE
+        return self._score_state(scenario['state'])
+    
     def compare_scenarios(self, scenarios: Dict[str, Dict]) -> List[Tuple[str, float]]:
         """Rank scenarios by desirability"""
-        scores = []
-        
-        for name, scenario in scenarios.items():
-            if scenario['violates_invariant']:
-                score = -100  # Automatic disqualification
-            else:
-                state = scenario['state']
-                # Higher coherence, lower uncertainty, lower risk = better
-                score = (
-                    state.coherence * 40 +
-                    (1 - state.uncertainty) * 30 +
-                    state.field['stability'] * 20 +
-                    (1 - state.field['risk']) * 10
-                )
-            
-            scores.append((name, score))
-        
-        scores.sort(key=lambda x: x[1], reverse=True)
+        scores = [(name, self._score(scenario)) for name, scenario in scenarios.items()]
+        scores.sort(key=itemgetter(1), reverse=True)
         return scores
 
 
@@ -232,48 +205,79 @@ class CounterfactualEngine:
 class DecisionAnalyzer:
     """Analyzes decision points and recommends actions"""
     
+    CACHE_SIZE = 512
+    
+    # (action, urgency, reason) indexed by the condition bitmask
+    # (no_viable_path << 2) | (uncertainty > 0.7) << 1 | (coherence < 0.3),
+    # so each row encodes the precedence of the original if/elif ladder
+    RECOMMENDATIONS = (
+        ('MONITOR', 'low', 'System stable, maintain current state'),
+        ('INCREASE_COHERENCE', 'high', 'Low coherence risks drift'),
+        ('REDUCE_UNCERTAINTY', 'high', 'High uncertainty threatens stability'),
+        ('REDUCE_UNCERTAINTY', 'high', 'High uncertainty threatens stability'),
+    ) + (('CRITICAL_INTERVENTION', 'immediate', 'Current state violates invariants'),) * 4
+    
     def __init__(self):
         self.engine = CounterfactualEngine()
+        self._cached_analysis = lru_cache(maxsize=self.CACHE_SIZE)(self._analyze)
     
     def analyze(self, coherence: float, uncertainty: float) -> Dict:
-        """Full decision analysis"""
+        """Full decision analysis, memoized per base state"""
+        result = self._cached_analysis(coherence, uncertainty)
+        
+        # Cache hits still leave one exploration record per call
+        recorded = self._copy_result(result)
+        self.engine.explorations.append({
+            'base_state': recorded['base_state'],
+            'scenarios': recorded['scenarios'],
+        })
+        return self._copy_result(result)
+    
+    def analyze_batch(self, coherences: List[float], uncertainties: List[float]) -> List[Dict]:
+        """Recommendations for many states without building full scenario reports"""
+        has_viable_path = self.engine.has_viable_path
+        return [self._recommend(not has_viable_path(c, u), c, u)
+                for c, u in zip(coherences, uncertainties)]
+    
+    def _recommend(self, no_viable_path: bool, coherence: float, uncertainty: float) -> Dict:
+        """Look up the recommendation for a state's condition bitmask"""
+        code = (no_viable_path << 2) | ((uncertainty > 0.7) << 1) | (coherence < 0.3)
+        action, urgency, reason = self.RECOMMENDATIONS[code]
+        return {
+            'action': action,
+            'urgency': urgency,
+            'reason': reason
+        }
+    
+    @staticmethod
+    def _copy_result(result: Dict) -> Dict:
+        """Copy the mutable parts of a cached result so callers never share them"""
+        base = result['base_state']
+        return {
+            'base_state': {**base, 'field': dict(base['field'])},
+            'scenarios': {
+                name: {**scenario, 'state': {**scenario['state'],
+                                             'field': dict(scenario['state']['field'])}}
+                for name, scenario in result['scenarios'].items()
+            },
+            'rankings': list(result['rankings']),
+            'recommendation': dict(result['recommendation']),
+            'analysis': result['analysis'],
+        }
+    
+    def _analyze(self, coherence: float, uncertainty: float) -> Dict:
         base_state = AwarenessState(coherence, uncertainty, {})
         base_state.compute_field()
         
-        scenarios = self.engine.explore(base_state)
+        scenarios = self.engine.explore(base_state, record=False)
         rankings = self.engine.compare_scenarios(scenarios)
         
         # Determine recommendation
-        valid_scenarios = [(n, s) for n, s in scenarios.items() 
-                          if not s['violates_invariant']]
-        
-        if not valid_scenarios:
-            recommendation = {
-                'action': 'CRITICAL_INTERVENTION',
-                'urgency': 'immediate',
-                'reason': 'Current state violates invariants'
-            }
-        elif base_state.uncertainty > 0.7:
-            recommendation = {
-                'action': 'REDUCE_UNCERTAINTY',
-                'urgency': 'high',
-                'reason': 'High uncertainty threatens stability'
-            }
-        elif base_state.coherence < 0.3:
-            recommendation = {
-                'action': 'INCREASE_COHERENCE',
-                'urgency': 'high',
-                'reason': 'Low coherence risks drift'
-            }
-        else:
-            recommendation = {
-                'action': 'MONITOR',
-                'urgency': 'low',
-                'reason': 'System stable, maintain current state'
-            }
+        no_viable_path = all(s['violates_invariant'] for s in scenarios.values())
+        recommendation = self._recommend(no_viable_path, coherence, uncertainty)
         
         return {
-            'base_state': asdict(base_state),
+            'base_state': base_state.to_dict(),
             'scenarios': {k: self.engine._scenario_to_dict(v) 
                          for k, v in scenarios.items()},
             'rankings': rankings,
@@ -351,8 +355,7 @@ def run_analysis():
     
     # Save comprehensive report
     output_file = Path('counterfactual_analysis.json')
-    with output_file.open('w') as f:
-        json.dump(all_results, f, indent=2)
+    write_json(output_file, all_results)
     
     print(f"\n{'=' * 70}")
     print(f"Full analysis saved to: {output_file}")
@@ -10,17 +10,27 @@ Usage:
     python demo_nine_fields.py --scenario safety_stress
     python demo_nine_fields.py --scenario governance_crisis --steps 100
     python demo_nine_fields.py --steps 50 --noise 0.4 --speed fast
+    python demo_nine_fields.py --batch 8 --workers 4 --export
 """
 
+import io
 import math
+import sys
 import time
 import json
 import argparse
 import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Deque, List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ═══════════════════════════════════════════════════════════════
 # CONFIG
@@ -78,6 +88,20 @@ RESET = "\033[0m"
 BOLD  = "\033[1m"
 DIM   = "\033[2m"
 
+# Render strings built once; bars and rules are sliced to width
+FULL  = "█" * 60
+EMPTY = "░" * 30
+RULE  = "─" * 80
+DOUBLE_RULE = "═" * 78
+SPARK = "▁▂▃▄▅▆▇█"
+HUES  = ("\033[34m", "\033[36m", "\033[32m", "\033[33m", "\033[31m", "\033[35m")
+EVENT_COLORS = {
+    "UPDATE":  "\033[96m",
+    "GOVERN":  "\033[93m",
+    "IMAGINE": "\033[94m",
+    "BUFFER":  "\033[37m",
+}
+
 
 # ═══════════════════════════════════════════════════════════════
 # STATE STRUCTURES
@@ -115,12 +139,29 @@ class SystemState:
     buffer_size: int = 0
     updates: int = 0
     backbone_activations: List[float] = field(default_factory=list)
-    fields: List[FieldState] = field(default_factory=list)
+    # Per-field columns (struct-of-arrays), indexed like FIELD_NAMES
+    coherence: List[float] = field(default_factory=list)
+    uncertainty: List[float] = field(default_factory=list)
+    imagine_reward: List[float] = field(default_factory=list)
+    q_value: List[float] = field(default_factory=list)
+    alpha: List[float] = field(default_factory=list)
+    weight: List[float] = field(default_factory=list)
     world: WorldModelState = field(default_factory=WorldModelState)
     governor: GovernorState = field(default_factory=GovernorState)
-    events: List[Dict] = field(default_factory=list)
-    loss_history: List[float] = field(default_factory=list)
-    kl_history: List[float] = field(default_factory=list)
+    events: Deque[Dict] = field(default_factory=lambda: deque(maxlen=100))
+    loss_history: Deque[float] = field(default_factory=lambda: deque(maxlen=120))
+    kl_history: Deque[float] = field(default_factory=lambda: deque(maxlen=80))
+
+    @property
+    def fields(self) -> List[FieldState]:
+        """Per-field records materialized from the columns."""
+        return [
+            FieldState(name, c, u, r, q, a, w)
+            for name, c, u, r, q, a, w in zip(
+                FIELD_NAMES, self.coherence, self.uncertainty,
+                self.imagine_reward, self.q_value, self.alpha, self.weight,
+            )
+        ]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -159,7 +200,8 @@ SCENARIOS = {
 # MATH HELPERS (no torch dependency)
 # ═══════════════════════════════════════════════════════════════
 
-def softmax(logits: List[float]) -> List[float]:
+def softmax(logits: Sequence[float]) -> List[float]:
+    """Numerically stable softmax over any float sequence (list or array)."""
     max_l = max(logits)
     exp = [math.exp(l - max_l) for l in logits]
     s = sum(exp)
@@ -170,8 +212,108 @@ def clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
-def noise(scale: float) -> float:
-    return (random.random() - 0.5) * 2 * scale
+def noise(scale: float, rand=random.random) -> float:
+    return (rand() - 0.5) * 2 * scale
+
+
+def scaled_noise(draws: List[float], scale: float) -> List[float]:
+    """Map uniform [0, 1) draws to noise(scale) values."""
+    return [(r - 0.5) * 2 * scale for r in draws]
+
+
+# ═══════════════════════════════════════════════════════════════
+# STEP KERNEL
+# ═══════════════════════════════════════════════════════════════
+
+def _step_core(
+    backbone: List[float],
+    coh: List[float],
+    unc: List[float],
+    imr: List[float],
+    qv: List[float],
+    al: List[float],
+    weights: List[float],
+    ensemble: List[float],
+    imagined: List[float],
+    ens_idx: List[int],
+    target_c: List[float],
+    target_u: List[float],
+    nl: float,
+    discounts: List[float],
+    raw: List[float],
+) -> Tuple[int, float, float, float, float]:
+    """
+    Numeric core of one update() call, free of simulation state.
+
+    Updates backbone, the field columns, weights, ensemble and
+    imagined in place and returns
+    (dom_idx, dom_w, gov_loss, total_ir, kl).
+    `raw` holds the step's uniform draws in order: backbone,
+    five per field (field-major), ensemble, horizon, KL.
+    Clamps are inlined as max(lo, min(hi, v)) to skip the call.
+    """
+    n_fields = len(coh)
+    o_fields = len(backbone)
+    o_ens = o_fields + 5 * n_fields
+    o_img = o_ens + len(ensemble)
+    o_kl = o_img + len(discounts)
+
+    # ── Backbone (SharedBackbone.forward)
+    scale = nl * 0.15
+    for k in range(o_fields):
+        backbone[k] = max(0, min(1, backbone[k] + (raw[k] - 0.5) * 2 * scale))
+
+    # ── Field updates (NineField: policy + world model)
+    s_c, s_u, s_r, s_q = nl*0.03, nl*0.02, nl*0.04, nl*0.03
+    j = o_fields
+    for i in range(n_fields):
+        pull_c = (target_c[i] - coh[i]) * 0.04
+        pull_u = (target_u[i] - unc[i]) * 0.03
+
+        coh[i] = max(0.05, min(0.98, coh[i] + (raw[j] - 0.5) * 2 * s_c + pull_c))
+        unc[i] = max(0.02, min(0.98, unc[i] + (raw[j+1] - 0.5) * 2 * s_u + pull_u))
+        imr[i] = max(-0.5, min(1.0, imr[i] + (raw[j+2] - 0.5) * 2 * s_r))
+        qv[i]  = max(0.0, min(1.0, qv[i] + (raw[j+3] - 0.5) * 2 * s_q))
+        al[i]  = max(0.01, min(0.5, al[i] + (raw[j+4] - 0.5) * 2 * 0.003))
+        j += 5
+
+    # ── Governor (Governor.forward → softmax)
+    logits = [
+        c * 2.5 + (1 - u) * 1.5 + r
+        for c, u, r in zip(coh, unc, imr)
+    ]
+    weights[:] = softmax(logits)
+    # Both scans run in C; a Python-level single-pass argmax is slower
+    dom_w = max(weights)
+    dom_idx = weights.index(dom_w)
+
+    # ── Governance loss: -(weights · imagine_rewards).mean()
+    gov_loss = -sum(w * r for w, r in zip(weights, imr))
+    total_ir = sum(imr) / 9
+
+    # ── World model ensemble (WorldModel.forward)
+    scale = nl * 0.04
+    for k, idx in enumerate(ens_idx):
+        ensemble[k] = max(0, min(1,
+            ensemble[k] * 0.9 + unc[idx] * 0.1 * 0.5
+            + (raw[o_ens + k] - 0.5) * 2 * scale
+        ))
+
+    # ── Imagination horizon (WorldModel.imagine)
+    scale = nl * 0.03
+    for t, d in enumerate(discounts):
+        imagined[t] = max(-0.5, min(1.0,
+            total_ir * d + (raw[o_img + t] - 0.5) * 2 * scale
+        ))
+
+    # ── KL divergence
+    avg_kl = sum(
+        u * (1 - c) * 0.5
+        for c, u in zip(coh, unc)
+    ) / 9
+    kl = max(0, min(1, avg_kl + (raw[o_kl] - 0.5) * 2 * (nl * 0.01)))
+
+    return dom_idx, dom_w, gov_loss, total_ir, kl
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -198,48 +340,84 @@ class NineFieldSimulation:
         noise_level: float = 0.20,
         seed: int = 42,
     ):
-        random.seed(seed)
+        self.rng = random.Random(seed)
         self.cfg = cfg
         self.noise_level = noise_level
         self.scenario = scenario
         self.s = SystemState()
         self._init_state()
+        # Field read by each ensemble member
+        self._ens_idx = [i % len(FIELD_NAMES) for i in range(cfg.ensemble)]
+        # gamma ** t over the imagination horizon
+        self._discounts = [cfg.gamma ** t for t in range(cfg.imagination_horizon)]
+        # Backbone, five attributes per field, ensemble, horizon, KL
+        self._draws_per_step = (
+            len(self.s.backbone_activations) + 5 * len(FIELD_NAMES)
+            + cfg.ensemble + cfg.imagination_horizon + 1
+        )
+
+    def set_scenario(self, scenario: str):
+        """Switch scenario presets; field state carries over."""
+        self.scenario = scenario
+        self._build_targets()
+
+    def _build_targets(self):
+        """Per-field coherence/uncertainty targets for the current scenario."""
+        preset = SCENARIOS[self.scenario]
+        stressed = set(preset["stressed_fields"])
+        self._target_c = [
+            0.25 if i in stressed else preset["target_coherence"]
+            for i in range(len(FIELD_NAMES))
+        ]
+        self._target_u = [
+            0.75 if i in stressed else preset["target_uncertainty"]
+            for i in range(len(FIELD_NAMES))
+        ]
 
     def _init_state(self):
         """Initialize system state from scenario preset."""
         preset = SCENARIOS[self.scenario]
-
-        self.s.fields = []
-        for i, name in enumerate(FIELD_NAMES):
-            stressed = i in preset["stressed_fields"]
-            self.s.fields.append(FieldState(
-                name=name,
-                coherence=clamp(
-                    preset["target_coherence"] + noise(0.15), 0.05, 0.98
-                ) if not stressed else clamp(
-                    0.20 + noise(0.08), 0.05, 0.40
-                ),
-                uncertainty=clamp(
-                    preset["target_uncertainty"] + noise(0.1), 0.02, 0.98
-                ) if not stressed else clamp(
-                    0.70 + noise(0.1), 0.50, 0.95
-                ),
-                imagine_reward=clamp(0.3 + noise(0.2), 0.0, 1.0),
-                q_value=clamp(0.4 + noise(0.3), 0.0, 1.0),
-                alpha=clamp(0.15 + noise(0.05), 0.01, 0.5),
-                weight=1.0 / 9,
-            ))
-
-        self.s.world = WorldModelState(
-            ensemble_disagreement=[clamp(random.random() * 0.3, 0, 1)
-                                   for _ in range(self.cfg.ensemble)],
-            imagined_rewards=[clamp(0.2 + noise(0.1), -0.5, 1.0)
-                              for _ in range(self.cfg.imagination_horizon)],
+        self._build_targets()
+
+        n_fields = len(FIELD_NAMES)
+        n_ens = self.cfg.ensemble
+        n_img = self.cfg.imagination_horizon
+        o_ens = 5 * n_fields
+        o_img = o_ens + n_ens
+        o_bb = o_img + n_img
+
+        # Every uniform draw for initialization, in the original draw order:
+        # five per field (field-major), ensemble, horizon, backbone
+        draw = self.rng.random
+        raw = [draw() for _ in range(o_bb + 32)]
+        field_raw = raw[:o_ens]
+        stressed = set(preset["stressed_fields"])
+
+        s = self.s
+        s.coherence = [
+            clamp(0.20 + (r - 0.5) * 2 * 0.08, 0.05, 0.40) if i in stressed
+            else clamp(preset["target_coherence"] + (r - 0.5) * 2 * 0.15, 0.05, 0.98)
+            for i, r in enumerate(field_raw[0::5])
+        ]
+        s.uncertainty = [
+            clamp(0.70 + (r - 0.5) * 2 * 0.1, 0.50, 0.95) if i in stressed
+            else clamp(preset["target_uncertainty"] + (r - 0.5) * 2 * 0.1, 0.02, 0.98)
+            for i, r in enumerate(field_raw[1::5])
+        ]
+        s.imagine_reward = [clamp(0.3 + n, 0.0, 1.0) for n in scaled_noise(field_raw[2::5], 0.2)]
+        s.q_value = [clamp(0.4 + n, 0.0, 1.0) for n in scaled_noise(field_raw[3::5], 0.3)]
+        s.alpha = [clamp(0.15 + n, 0.01, 0.5) for n in scaled_noise(field_raw[4::5], 0.05)]
+        s.weight = [1.0 / 9] * n_fields
+
+        s.world = WorldModelState(
+            ensemble_disagreement=[clamp(r * 0.3, 0, 1) for r in raw[o_ens:o_img]],
+            imagined_rewards=[clamp(0.2 + n, -0.5, 1.0)
+                              for n in scaled_noise(raw[o_img:o_bb], 0.1)],
             kl=0.1,
         )
 
-        self.s.backbone_activations = [random.random() for _ in range(32)]
-        self.s.governor = GovernorState(dominant_field=FIELD_NAMES[0])
+        s.backbone_activations = raw[o_bb:]
+        s.governor = GovernorState(dominant_field=FIELD_NAMES[0])
 
     # ─── STEP ────────────────────────────────────────────────
 
@@ -251,85 +429,32 @@ class NineFieldSimulation:
             self.cfg.buffer_size
         )
 
-        preset = SCENARIOS[self.scenario]
         nl = self.noise_level
 
-        # ── Backbone (SharedBackbone.forward)
-        self.s.backbone_activations = [
-            clamp(v + noise(nl * 0.15), 0, 1)
-            for v in self.s.backbone_activations
-        ]
-
-        # ── Field updates (NineField: policy + world model)
-        for i, f in enumerate(self.s.fields):
-            stressed = i in preset["stressed_fields"]
-            target_c = 0.25 if stressed else preset["target_coherence"]
-            target_u = 0.75 if stressed else preset["target_uncertainty"]
-
-            pull_c = (target_c - f.coherence) * 0.04
-            pull_u = (target_u - f.uncertainty) * 0.03
-
-            f.coherence    = clamp(f.coherence    + noise(nl*0.03) + pull_c, 0.05, 0.98)
-            f.uncertainty  = clamp(f.uncertainty  + noise(nl*0.02) + pull_u, 0.02, 0.98)
-            f.imagine_reward = clamp(f.imagine_reward + noise(nl*0.04), -0.5, 1.0)
-            f.q_value      = clamp(f.q_value      + noise(nl*0.03), 0.0, 1.0)
-            f.alpha        = clamp(f.alpha         + noise(0.003),  0.01, 0.5)
-
-        # ── Governor (Governor.forward → softmax)
-        logits = [
-            f.coherence * 2.5 + (1 - f.uncertainty) * 1.5 + f.imagine_reward
-            for f in self.s.fields
-        ]
-        weights = softmax(logits)
-        for f, w in zip(self.s.fields, weights):
-            f.weight = w
-
-        dom_idx = weights.index(max(weights))
-
-        # ── Governance loss: -(weights · imagine_rewards).mean()
-        gov_loss = -sum(
-            w * f.imagine_reward
-            for w, f in zip(weights, self.s.fields)
+        # Every uniform draw for this step, in the original draw order
+        draw = self.rng.random
+        raw = [draw() for _ in range(self._draws_per_step)]
+
+        s = self.s
+        dom_idx, dom_w, gov_loss, total_ir, s.world.kl = _step_core(
+            s.backbone_activations,
+            s.coherence, s.uncertainty, s.imagine_reward, s.q_value, s.alpha,
+            s.weight, s.world.ensemble_disagreement, s.world.imagined_rewards,
+            self._ens_idx,
+            self._target_c, self._target_u,
+            nl, self._discounts, raw,
         )
-        total_ir = sum(f.imagine_reward for f in self.s.fields) / 9
 
         self.s.governor = GovernorState(
             governance_loss=abs(gov_loss),
             dominant_field=FIELD_NAMES[dom_idx],
-            dominant_weight=weights[dom_idx],
+            dominant_weight=dom_w,
             total_imagine_reward=total_ir,
         )
 
-        # ── World model ensemble (WorldModel.forward)
-        self.s.world.ensemble_disagreement = [
-            clamp(v * 0.9 + self.s.fields[i % 9].uncertainty * 0.1 * 0.5
-                  + noise(nl * 0.04), 0, 1)
-            for i, v in enumerate(self.s.world.ensemble_disagreement)
-        ]
-
-        # ── Imagination horizon (WorldModel.imagine)
-        self.s.world.imagined_rewards = [
-            clamp(
-                total_ir * (self.cfg.gamma ** t) + noise(nl * 0.03),
-                -0.5, 1.0
-            )
-            for t in range(self.cfg.imagination_horizon)
-        ]
-
-        # ── KL divergence
-        avg_kl = sum(
-            f.uncertainty * (1 - f.coherence) * 0.5
-            for f in self.s.fields
-        ) / 9
-        self.s.world.kl = clamp(avg_kl + noise(nl * 0.01), 0, 1)
-
         # ── History
         self.s.loss_history.append(self.s.governor.governance_loss)
         self.s.kl_history.append(self.s.world.kl)
-        if len(self.s.loss_history) > 120:
-            self.s.loss_history.pop(0)
-        if len(self.s.kl_history) > 80:
-            self.s.kl_history.pop(0)
 
         # ── Updates counter
         if self.s.buffer_size >= self.cfg.batch_size:
@@ -341,8 +466,10 @@ class NineFieldSimulation:
         return self.s
 
     def _emit_events(self):
-        ts = time.strftime("%H:%M:%S")
         step = self.s.step
+        if step % 8 and step % 15 and step % 20 and step % 50:
+            return
+        ts = time.strftime("%H:%M:%S")
 
         if step % 8 == 0:
             self.s.events.append({
@@ -372,15 +499,17 @@ class NineFieldSimulation:
                        f"  updates={self.s.updates:,}"
             })
 
-        # Keep last 100 events
-        if len(self.s.events) > 100:
-            self.s.events = self.s.events[-100:]
-
 
 # ═══════════════════════════════════════════════════════════════
 # TERMINAL RENDERER
 # ═══════════════════════════════════════════════════════════════
 
+def spark(values: Sequence[float], lo: float, hi: float) -> str:
+    """Join one sparkline glyph per value, scaled into [lo, hi]."""
+    span = (hi - lo) or 0.001
+    return "".join([SPARK[int((v - lo) / span * 7)] for v in values])
+
+
 class TerminalRenderer:
     """Renders SystemState to terminal — mirrors demo_nine_fields.html panels."""
 
@@ -388,28 +517,33 @@ class TerminalRenderer:
         self.cfg = cfg
 
     def render(self, s: SystemState):
-        self._clear()
-        self._header(s)
-        self._fields(s)
-        self._governor(s)
-        self._world_model(s)
-        self._backbone(s)
-        self._events(s)
-
-    def _clear(self):
-        print("\033[H\033[2J", end="")
-
-    def _header(self, s: SystemState):
-        print(f"\n  {BOLD}9DA™ Nine-Field Examiner{RESET}  ·  Neural Governance Architecture")
-        print(f"  {DIM}step={s.step}  buffer={s.buffer_size:,}  updates={s.updates:,}{RESET}\n")
-
-    def _fields(self, s: SystemState):
-        print(f"  {DIM}── NINE DIMENSIONAL FIELDS {'─'*54}{RESET}")
-        print()
+        # Compose the whole frame, then hand it to the terminal in one write
+        buf = io.StringIO()
+        out = buf.write
+        self._clear(out)
+        self._header(s, out)
+        self._fields(s, out)
+        self._governor(s, out)
+        self._world_model(s, out)
+        self._backbone(s, out)
+        self._events(s, out)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+    def _clear(self, out: Callable[[str], int]):
+        out("\033[H\033[2J")
+
+    def _header(self, s: SystemState, out: Callable[[str], int]):
+        out(f"\n  {BOLD}9DA™ Nine-Field Examiner{RESET}  ·  Neural Governance Architecture\n")
+        out(f"  {DIM}step={s.step}  buffer={s.buffer_size:,}  updates={s.updates:,}{RESET}\n\n")
+
+    def _fields(self, s: SystemState, out: Callable[[str], int]):
+        out(f"  {DIM}── NINE DIMENSIONAL FIELDS {RULE[:54]}{RESET}\n")
+        out("\n")
 
         header = f"  {'FIELD':<30} {'WEIGHT':>8} {'COHERENCE':>10} {'UNCERTAINTY':>12} {'Q-VALUE':>8} {'ALPHA':>7}"
-        print(f"  {DIM}{header}{RESET}")
-        print(f"  {DIM}{'─'*80}{RESET}")
+        out(f"  {DIM}{header}{RESET}\n")
+        out(f"  {DIM}{RULE}{RESET}\n")
 
         for f in s.fields:
             col = FIELD_COLORS_ANSI.get(f.name, "")
@@ -427,118 +561,100 @@ class TerminalRenderer:
             )
 
             bar_w = int(f.weight * 30)
-            bar = "█" * bar_w + "░" * (30 - bar_w)
+            bar = FULL[:bar_w] + EMPTY[:30 - bar_w]
 
-            print(
+            out(
                 f"  {col}{f.name:<30}{RESET}"
                 f"  {col}{f.weight:>7.4f}{RESET}{dom}"
                 f"  {coh_col}{f.coherence:>9.4f}{RESET}"
                 f"  {unc_col}{f.uncertainty:>11.4f}{RESET}"
                 f"  {f.q_value:>8.4f}"
-                f"  {f.alpha:>7.4f}"
+                f"  {f.alpha:>7.4f}\n"
             )
 
-        print()
+        out("\n")
         # Weight distribution bar
-        print(f"  {DIM}Weight Distribution{RESET}")
+        out(f"  {DIM}Weight Distribution{RESET}\n")
         total_w = 0
-        print("  ", end="")
+        out("  ")
         for f in s.fields:
             col = FIELD_COLORS_ANSI.get(f.name, "")
             segs = max(1, int(f.weight * 60))
-            print(f"{col}{'█'*segs}{RESET}", end="")
+            out(f"{col}{FULL[:segs]}{RESET}")
             total_w += segs
-        print()
-        print()
+        out("\n")
+        out("\n")
 
-    def _governor(self, s: SystemState):
+    def _governor(self, s: SystemState, out: Callable[[str], int]):
         g = s.governor
-        print(f"  {DIM}── GOVERNOR {'─'*66}{RESET}")
-        print()
-        print(f"  governance_loss   {BOLD}{g.governance_loss:>12.6f}{RESET}")
-        print(f"  dominant_field    {FIELD_COLORS_ANSI.get(g.dominant_field,'')}"
-              f"{g.dominant_field:<30}{RESET}  weight={g.dominant_weight:.4f}")
-        print(f"  total_img_reward  {g.total_imagine_reward:>12.6f}")
+        out(f"  {DIM}── GOVERNOR {RULE[:66]}{RESET}\n")
+        out("\n")
+        out(f"  governance_loss   {BOLD}{g.governance_loss:>12.6f}{RESET}\n")
+        out(f"  dominant_field    {FIELD_COLORS_ANSI.get(g.dominant_field,'')}"
+            f"{g.dominant_field:<30}{RESET}  weight={g.dominant_weight:.4f}\n")
+        out(f"  total_img_reward  {g.total_imagine_reward:>12.6f}\n")
 
         if len(s.loss_history) > 1:
             _min = min(s.loss_history)
             _max = max(s.loss_history) or 0.001
-            chart = ""
-            bars = "▁▂▃▄▅▆▇█"
             step = max(1, len(s.loss_history) // 60)
-            for v in s.loss_history[::step][-60:]:
-                idx = int((v - _min) / (_max - _min) * 7)
-                chart += bars[idx]
-            print(f"  loss_history      {DIM}{chart}{RESET}")
+            chart = spark(list(s.loss_history)[::step][-60:], _min, _max)
+            out(f"  loss_history      {DIM}{chart}{RESET}\n")
 
-        print()
+        out("\n")
 
-    def _world_model(self, s: SystemState):
+    def _world_model(self, s: SystemState, out: Callable[[str], int]):
         w = s.world
-        print(f"  {DIM}── WORLD MODEL  ensemble={self.cfg.ensemble}  horizon={self.cfg.imagination_horizon} {'─'*40}{RESET}")
-        print()
+        out(f"  {DIM}── WORLD MODEL  ensemble={self.cfg.ensemble}  horizon={self.cfg.imagination_horizon} {RULE[:40]}{RESET}\n")
+        out("\n")
 
         # Ensemble disagreement
-        print(f"  {DIM}Ensemble Disagreement (7 members){RESET}")
-        print("  ", end="")
+        out(f"  {DIM}Ensemble Disagreement (7 members){RESET}\n")
+        out("  ")
         for i, v in enumerate(w.ensemble_disagreement):
             col = "\033[92m" if v < 0.3 else "\033[93m" if v < 0.6 else "\033[91m"
             bar_h = int(v * 8)
-            bar = "█" * bar_h + "░" * (8 - bar_h)
-            print(f" M{i+1}{col}{bar}{RESET}", end="")
-        print()
+            bar = FULL[:bar_h] + EMPTY[:8 - bar_h]
+            out(f" M{i+1}{col}{bar}{RESET}")
+        out("\n")
 
         # Imagined reward horizon
-        print(f"\n  {DIM}Imagined Reward Horizon (γ={self.cfg.gamma}){RESET}")
-        print("  ", end="")
+        out(f"\n  {DIM}Imagined Reward Horizon (γ={self.cfg.gamma}){RESET}\n")
+        out("  ")
         for t, v in enumerate(w.imagined_rewards):
             col = "\033[92m" if v >= 0 else "\033[91m"
-            bar = "█" * max(1, int(abs(v) * 8))
-            print(f" t+{t+1}{col}{bar[:8]}{RESET}", end="")
-        print()
+            bar = FULL[:max(1, int(abs(v) * 8))]
+            out(f" t+{t+1}{col}{bar[:8]}{RESET}")
+        out("\n")
 
         # KL divergence
         if len(s.kl_history) > 1:
-            bars = "▁▂▃▄▅▆▇█"
             _min = min(s.kl_history)
             _max = max(s.kl_history) or 0.001
-            chart = ""
-            for v in s.kl_history[-60:]:
-                idx = int((v - _min) / (_max - _min) * 7)
-                chart += bars[idx]
-            print(f"\n  {DIM}KL Divergence {RESET}{DIM}{chart}{RESET}  {w.kl:.4f}")
-
-        print()
-
-    def _backbone(self, s: SystemState):
-        print(f"  {DIM}── SHARED BACKBONE  model_dim={self.cfg.model_dim}  heads={self.cfg.heads}  layers={self.cfg.layers} {'─'*20}{RESET}")
-        print()
-        print(f"  {DIM}Activations (projected 768→32){RESET}")
-        print("  ", end="")
+            chart = spark(list(s.kl_history)[-60:], _min, _max)
+            out(f"\n  {DIM}KL Divergence {RESET}{DIM}{chart}{RESET}  {w.kl:.4f}\n")
+
+        out("\n")
+
+    def _backbone(self, s: SystemState, out: Callable[[str], int]):
+        out(f"  {DIM}── SHARED BACKBONE  model_dim={self.cfg.model_dim}  heads={self.cfg.heads}  layers={self.cfg.layers} {RULE[:20]}{RESET}\n")
+        out("\n")
+        out(f"  {DIM}Activations (projected 768→32){RESET}\n")
+        out("  ")
         for v in s.backbone_activations:
-            hue_idx = int(v * 5)
-            colors = ["\033[34m", "\033[36m", "\033[32m", "\033[33m", "\033[31m", "\033[35m"]
-            col = colors[min(hue_idx, 5)]
-            bars = "▁▂▃▄▅▆▇█"
-            idx = int(v * 7)
-            print(f"{col}{bars[idx]}{RESET}", end="")
-        print()
-        print()
-
-    def _events(self, s: SystemState):
-        print(f"  {DIM}── EVENT LOG {'─'*65}{RESET}")
-        print()
-        recent = s.events[-8:]
-        type_colors = {
-            "UPDATE": "\033[96m",
-            "GOVERN": "\033[93m",
-            "IMAGINE": "\033[94m",
-            "BUFFER": "\033[37m",
-        }
+            col = HUES[min(int(v * 5), 5)]
+            out(f"{col}{SPARK[int(v * 7)]}{RESET}")
+        out("\n")
+        out("\n")
+
+    def _events(self, s: SystemState, out: Callable[[str], int]):
+        out(f"  {DIM}── EVENT LOG {RULE[:65]}{RESET}\n")
+        out("\n")
+        recent = list(s.events)[-8:]
         for ev in reversed(recent):
-            col = type_colors.get(ev["type"], "\033[37m")
-            print(f"  {DIM}{ev['time']}{RESET}  {col}{ev['type']:<8}{RESET}  {DIM}{ev['msg']}{RESET}")
-        print()
+            col = EVENT_COLORS.get(ev["type"], "\033[37m")
+            out(f"  {DIM}{ev['time']}{RESET}  {col}{ev['type']:<8}{RESET}  {DIM}{ev['msg']}{RESET}\n")
+        out("\n")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -546,9 +662,9 @@ class TerminalRenderer:
 # ═══════════════════════════════════════════════════════════════
 
 def print_summary(s: SystemState, scenario: str):
-    print("\n" + "═"*78)
+    print("\n" + DOUBLE_RULE)
     print(f"  {BOLD}NINE-FIELD EXAMINER — FINAL REPORT{RESET}")
-    print("═"*78)
+    print(DOUBLE_RULE)
     print()
     print(f"  Scenario         {scenario}")
     print(f"  Steps            {s.step}")
@@ -562,7 +678,7 @@ def print_summary(s: SystemState, scenario: str):
     print()
     for f in sorted(s.fields, key=lambda x: x.weight, reverse=True):
         col = FIELD_COLORS_ANSI.get(f.name, "")
-        bar = "█" * int(f.weight * 50)
+        bar = FULL[:int(f.weight * 50)]
         print(f"  {col}{f.name:<30}{RESET}  {f.weight:.4f}  {DIM}{bar}{RESET}")
 
     print()
@@ -572,7 +688,7 @@ def print_summary(s: SystemState, scenario: str):
     coherences.sort(key=lambda x: x[1], reverse=True)
     for name, c in coherences:
         col = "\033[92m" if c > 0.6 else "\033[93m" if c > 0.35 else "\033[91m"
-        bar = "█" * int(c * 30)
+        bar = FULL[:int(c * 30)]
         print(f"  {name:<30}  {col}{c:.4f}  {bar}{RESET}")
 
     print()
@@ -590,6 +706,15 @@ def print_summary(s: SystemState, scenario: str):
 # JSON EXPORT
 # ═══════════════════════════════════════════════════════════════
 
+def write_json(path: str, obj) -> None:
+    """Write obj as indented JSON, via orjson when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+
 def export_report(s: SystemState, scenario: str, path: str = "nine_fields_report.json"):
     report = {
         "scenario": scenario,
@@ -604,30 +729,90 @@ def export_report(s: SystemState, scenario: str, path: str = "nine_fields_report
         },
         "fields": [
             {
-                "name": f.name,
-                "weight": f.weight,
-                "coherence": f.coherence,
-                "uncertainty": f.uncertainty,
-                "q_value": f.q_value,
-                "alpha": f.alpha,
-                "imagine_reward": f.imagine_reward,
+                "name": n,
+                "weight": w,
+                "coherence": c,
+                "uncertainty": u,
+                "q_value": q,
+                "alpha": a,
+                "imagine_reward": r,
             }
-            for f in s.fields
+            for n, w, c, u, q, a, r in zip(
+                FIELD_NAMES, s.weight, s.coherence, s.uncertainty,
+                s.q_value, s.alpha, s.imagine_reward,
+            )
         ],
         "world_model": {
             "ensemble_disagreement": s.world.ensemble_disagreement,
             "imagined_rewards": s.world.imagined_rewards,
             "final_kl": s.world.kl,
         },
-        "loss_history": s.loss_history,
-        "kl_history": s.kl_history,
-        "events": s.events[-50:],
+        "loss_history": list(s.loss_history),
+        "kl_history": list(s.kl_history),
+        "events": list(s.events)[-50:],
     }
-    with open(path, "w") as f:
-        json.dump(report, f, indent=2)
+    write_json(path, report)
     print(f"  Report exported → {path}")
 
 
+# ═══════════════════════════════════════════════════════════════
+# BATCH RUNS
+# ═══════════════════════════════════════════════════════════════
+
+BatchJob = Tuple[str, Optional[int], float, int]
+
+
+def summarize(s: SystemState, scenario: str, seed: Optional[int], noise_level: float) -> Dict:
+    """Final-state summary of one run, small enough to ship between processes."""
+    n = len(s.coherence)
+    return {
+        "scenario": scenario,
+        "seed": seed,
+        "noise": noise_level,
+        "steps": s.step,
+        "final_loss": s.governor.governance_loss,
+        "dominant_field": s.governor.dominant_field,
+        "dominant_weight": s.governor.dominant_weight,
+        "total_imagine_reward": s.governor.total_imagine_reward,
+        "final_kl": s.world.kl,
+        "mean_coherence": sum(s.coherence) / n,
+        "mean_uncertainty": sum(s.uncertainty) / n,
+    }
+
+
+def run_one(job: BatchJob) -> Dict:
+    """Run one (scenario, seed, noise, steps) simulation without rendering."""
+    scenario, seed, noise_level, steps = job
+    sim = NineFieldSimulation(NineDADemoConfig(), scenario, noise_level, seed=seed)
+    for _ in range(steps):
+        sim.step()
+    return summarize(sim.s, scenario, seed, noise_level)
+
+
+def run_batch(jobs: Sequence[BatchJob], workers: Optional[int] = None) -> List[Dict]:
+    """Run independent simulations across a process pool, in job order."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, jobs))
+
+
+def print_batch_summary(results: List[Dict]):
+    print("\n" + DOUBLE_RULE)
+    print(f"  {BOLD}NINE-FIELD EXAMINER — BATCH REPORT{RESET}  ({len(results)} runs)")
+    print(DOUBLE_RULE)
+    print()
+    print(f"  {'scenario':<20}{'runs':>6}{'mean loss':>12}{'mean kl':>10}  top dominant field")
+    for scenario in SCENARIOS:
+        runs = [r for r in results if r["scenario"] == scenario]
+        if not runs:
+            continue
+        loss = sum(r["final_loss"] for r in runs) / len(runs)
+        kl = sum(r["final_kl"] for r in runs) / len(runs)
+        dominant = [r["dominant_field"] for r in runs]
+        top = max(dominant, key=dominant.count)
+        print(f"  {scenario:<20}{len(runs):>6}{loss:>12.6f}{kl:>10.4f}  {top}")
+    print()
+
+
 # ═══════════════════════════════════════════════════════════════
 # MAIN
 # ═══════════════════════════════════════════════════════════════
@@ -671,8 +856,34 @@ def main():
         dest="no_render",
         help="Suppress terminal rendering (fastest)"
     )
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=0,
+        help="Run seeds 0..N-1 of every scenario in parallel, without rendering"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)"
+    )
     args = parser.parse_args()
 
+    if args.batch > 0:
+        jobs = [
+            (scenario, seed, args.noise, args.steps)
+            for scenario in SCENARIOS
+            for seed in range(args.batch)
+        ]
+        results = run_batch(jobs, args.workers)
+        print_batch_summary(results)
+        if args.export:
+            path = "nine_fields_batch.json"
+            write_json(path, results)
+            print(f"  Batch report exported → {path}")
+        return
+
     delays = {"slow": 0.3, "normal": 0.08, "fast": 0.02, "instant": 0.0}
     delay = delays[args.speed]
 
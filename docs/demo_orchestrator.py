@@ -1,84 +1,351 @@
 import asyncio
 import subprocess
+import contextlib
 import json
 import re
+import runpy
 import sys
 import os
 import ast
+import threading
+import traceback
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, AsyncIterator, Callable, Iterator, List, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 SYSTEM2 = "system2.py"
 SYSTEM1 = "system1.py"
 SHADOW_INPUT = Path("shadow_input.json")
+STREAM_LIMIT = 1024 * 1024
+# In-process stages share sys.stdout, sys.argv and os.environ
+STAGE_LOCK = threading.Lock()
+
+CYCLE_RE = re.compile(r"CYCLE\s+\d+.*?(?=CYCLE|\Z)", re.S)
+COHERENCE_RE = re.compile(r"coherence:\s*([0-9.]+)")
+UNCERTAINTY_RE = re.compile(r"uncertainty:\s*([0-9.]+)")
+FIELD_RE = re.compile(r"field:\s*({.*?})", re.S)
+# All three values in one pass, for blocks in the usual key order
+BLOCK_RE = re.compile(
+    r"coherence:\s*([0-9.]+).*?uncertainty:\s*([0-9.]+).*?field:\s*({.*?})", re.S
+)
+# A field dict holding only quoted keys and plain numeric literals
+FIELD_PAIR = (
+    r"(\"[^\"\\\n]*\"|'[^'\\\n]*')[ \t\r\n]*:[ \t\r\n]*"
+    r"([-+]?(?:(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+    r"|[0-9]+[eE][-+]?[0-9]+|0|[1-9][0-9]*))"
+)
+FIELD_PAIR_RE = re.compile(FIELD_PAIR)
+FLAT_FIELD_RE = re.compile(
+    r"\{[ \t\r\n]*(?:%s[ \t\r\n]*(?:,[ \t\r\n]*|(?=\})))*\}" % FIELD_PAIR
+)
+
+
+# -----------------------------
+# In-Process Stage Runner
+# -----------------------------
+
+class StageStopped(BaseException):
+    """Raised inside a stage thread once nothing reads its output."""
+
+
+class ThreadStdout:
+    """sys.stdout stand-in that routes one thread's writes to a line sink."""
+
+    def __init__(self, target, on_line: Callable[[str], None]):
+        self.target = target
+        self.on_line = on_line
+        self.thread_id = threading.get_ident()
+        self.pending = ""
+
+    def write(self, text: str) -> int:
+        # Anything printed by other threads (the event loop included)
+        # still reaches the real stdout
+        if threading.get_ident() != self.thread_id:
+            return self.target.write(text)
+
+        self.pending += text
+        if "\n" in self.pending:
+            *lines, self.pending = self.pending.split("\n")
+            for line in lines:
+                self.on_line(line + "\n")
+        return len(text)
+
+    def flush(self):
+        if threading.get_ident() != self.thread_id:
+            self.target.flush()
+
+    def close_lines(self):
+        if self.pending:
+            self.on_line(self.pending)
+            self.pending = ""
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+def run_stage(
+    script: str,
+    name: str,
+    on_line: Callable[[str], None],
+    env: Optional[Dict[str, str]] = None,
+    init_globals: Optional[Dict[str, Any]] = None
+) -> None:
+    # Execute a stage script as __main__ in this interpreter, passing each
+    # line it prints to on_line as it is written. The script sees the
+    # process-wide os.environ and sys.argv, so stages run one at a time
+    with STAGE_LOCK:
+        saved_env = {key: os.environ.get(key) for key in env or {}}
+        saved_argv = sys.argv
+        saved_stdout = sys.stdout
+        stdout = ThreadStdout(saved_stdout, on_line)
+        os.environ.update(env or {})
+        sys.argv = [script]
+        sys.stdout = stdout
+
+        try:
+            runpy.run_path(script, init_globals, run_name="__main__")
+        except SystemExit as exc:
+            if exc.code not in (None, 0):
+                raise RuntimeError(
+                    f"[{name} failed]\nexit status {exc.code}\n{traceback.format_exc()}"
+                )
+        except Exception as exc:
+            raise RuntimeError(f"[{name} failed]\n{traceback.format_exc()}") from exc
+        finally:
+            sys.stdout = saved_stdout
+            sys.argv = saved_argv
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+        stdout.close_lines()
 
 
 # -----------------------------
 # System 2 Runner
 # -----------------------------
 
-async def run_system2() -> str:
+async def stream_system2() -> AsyncIterator[Dict]:
     proc = await asyncio.create_subprocess_exec(
         sys.executable,
         SYSTEM2,
         stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE
+        stderr=asyncio.subprocess.PIPE,
+        limit=STREAM_LIMIT
     )
 
-    stdout, stderr = await proc.communicate()
+    # Drain stderr alongside stdout so neither pipe can fill and stall
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+    parser = CycleParser()
+    async for line in proc.stdout:
+        for signal in parser.feed(line.decode(errors="ignore")):
+            yield signal
+
+    for signal in parser.close():
+        yield signal
+
+    stderr = await stderr_task
+    await proc.wait()
 
     if proc.returncode != 0:
         raise RuntimeError(
             f"[System2 failed]\n{stderr.decode(errors='ignore')}"
         )
 
-    return stdout.decode(errors="ignore")
+
+async def stream_system2_in_process() -> AsyncIterator[Dict]:
+    # Same stream as stream_system2, with the stage run on a worker thread;
+    # signals are parsed as lines are printed and handed back through a queue
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    parser = CycleParser()
+    stopped = threading.Event()
+
+    def emit(signals: List[Dict]):
+        for signal in signals:
+            loop.call_soon_threadsafe(queue.put_nowait, signal)
+
+    def on_line(line: str):
+        # A consumer that stops early ends the stage at its next print
+        if stopped.is_set():
+            raise StageStopped
+        emit(parser.feed(line))
+
+    def run():
+        try:
+            run_stage(SYSTEM2, "System2", on_line)
+            emit(parser.close())
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    stage = asyncio.ensure_future(asyncio.to_thread(run))
+
+    try:
+        while True:
+            signal = await queue.get()
+            if signal is None:
+                break
+            yield signal
+
+        await stage
+    finally:
+        if not stage.done():
+            stopped.set()
+            with contextlib.suppress(StageStopped):
+                await stage
+
+
+async def run_system2(in_process: bool = True) -> List[Dict]:
+    stream = stream_system2_in_process() if in_process else stream_system2()
+    return [signal async for signal in stream]
 
 
 # -----------------------------
 # Signal Extraction
 # -----------------------------
 
+@lru_cache(maxsize=1024)
+def parse_field(raw: str) -> Dict:
+    # JSON when System 2 emits it, otherwise its Python dict repr;
+    # field values repeat across cycles, so parses are cached
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return ast.literal_eval(raw)
+
+
+def field_values(raw: str) -> Dict:
+    # Flat numeric dicts are read straight off the text; anything else
+    # (nested, string values, malformed) goes through the full parse
+    if FLAT_FIELD_RE.fullmatch(raw):
+        return {key[1:-1]: value for key, value in FIELD_PAIR_RE.findall(raw)}
+    return parse_field(raw)
+
+
+def parse_cycle(block: str) -> Optional[Dict]:
+    m = BLOCK_RE.search(block)
+    if m:
+        c_raw, u_raw, f_raw = m.groups()
+    else:
+        c = COHERENCE_RE.search(block)
+        u = UNCERTAINTY_RE.search(block)
+        f = FIELD_RE.search(block)
+
+        if not (c and u and f):
+            return None
+        c_raw, u_raw, f_raw = c.group(1), u.group(1), f.group(1)
+
+    try:
+        coherence = float(c_raw)
+        uncertainty = float(u_raw)
+        fields = field_values(f_raw)
+        novelty = float(fields.get("novelty", 0.0))
+        complexity = float(fields.get("complexity", 0.0))
+    except Exception:
+        return None
+
+    return {
+        "confidence": max(0.0, min(1.0, 1.0 - uncertainty)),
+        "coherence": max(0.0, min(1.0, coherence)),
+        "novelty": novelty,
+        "complexity": complexity,
+    }
+
+
 def extract_signals(text: str) -> List[Dict]:
     signals: List[Dict] = []
 
-    cycles = re.findall(
-        r"CYCLE\s+\d+.*?(?=CYCLE|\Z)",
-        text,
-        flags=re.S
-    )
+    for block in CYCLE_RE.findall(text):
+        signal = parse_cycle(block)
+        if signal:
+            signals.append(signal)
 
-    for block in cycles:
-        c = re.search(r"coherence:\s*([0-9.]+)", block)
-        u = re.search(r"uncertainty:\s*([0-9.]+)", block)
-        f = re.search(r"field:\s*({.*?})", block, re.S)
+    return signals
 
-        if not (c and u and f):
-            continue
 
-        try:
-            field = ast.literal_eval(f.group(1))
-            coherence = float(c.group(1))
-            uncertainty = float(u.group(1))
-        except Exception:
-            continue
-
-        signals.append({
-            "confidence": max(0.0, min(1.0, 1.0 - uncertainty)),
-            "coherence": max(0.0, min(1.0, coherence)),
-            "novelty": float(field.get("novelty", 0.0)),
-            "complexity": float(field.get("complexity", 0.0)),
-        })
+class CycleParser:
+    """Incremental CYCLE block parser, fed one line of output at a time."""
 
-    return signals
+    def __init__(self):
+        self.pending = ""
+
+    def feed(self, line: str) -> List[Dict]:
+        # A block is complete once the next CYCLE header follows it;
+        # only the still-open block is kept in the buffer
+        self.pending += line
+        signals: List[Dict] = []
+
+        end = 0
+        for match in CYCLE_RE.finditer(self.pending):
+            if match.end() == len(self.pending):
+                end = match.start()
+                break
+            signal = parse_cycle(match.group(0))
+            if signal:
+                signals.append(signal)
+            end = match.end()
+        else:
+            start = self.pending.rfind("CYCLE", end)
+            end = start if start >= 0 else len(self.pending)
+
+        self.pending = self.pending[end:]
+        return signals
+
+    def close(self) -> List[Dict]:
+        signals = extract_signals(self.pending)
+        self.pending = ""
+        return signals
 
 
 # -----------------------------
 # System 1 Runner
 # -----------------------------
 
-async def run_system1(signals: List[Dict]) -> str:
-    SHADOW_INPUT.write_text(json.dumps(signals, indent=2))
+def encode_signals(signals: List[Dict]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(signals, option=orjson.OPT_INDENT_2)
+    return json.dumps(signals, indent=2).encode()
+
+
+@contextlib.contextmanager
+def signals_input(signals: List[Dict]) -> Iterator[str]:
+    # A path System 1 can open like shadow_input.json, backed by an
+    # anonymous in-memory file so in-process runs skip the disk
+    if not hasattr(os, "memfd_create"):
+        SHADOW_INPUT.write_bytes(encode_signals(signals))
+        yield str(SHADOW_INPUT.resolve())
+        return
+
+    fd = os.memfd_create("shadow_input")
+    try:
+        with open(fd, "wb", closefd=False) as memfile:
+            memfile.write(encode_signals(signals))
+        yield f"/proc/self/fd/{fd}"
+    finally:
+        os.close(fd)
+
+
+async def run_system1(signals: List[Dict], in_process: bool = True) -> str:
+    if in_process:
+        # The signals are also handed over directly as AWARENESS_SIGNALS
+        lines: List[str] = []
+        with signals_input(signals) as awareness_input:
+            await asyncio.to_thread(
+                run_stage, SYSTEM1, "System1", lines.append,
+                {"AWARENESS_INPUT": awareness_input},
+                {"AWARENESS_SIGNALS": signals}
+            )
+        return "".join(lines)
+
+    SHADOW_INPUT.write_bytes(encode_signals(signals))
 
     env = dict(os.environ)
     env["AWARENESS_INPUT"] = str(SHADOW_INPUT.resolve())
@@ -105,14 +372,15 @@ async def run_system1(signals: List[Dict]) -> str:
 # Orchestration
 # -----------------------------
 
-async def orchestrate():
-    system2_output = await run_system2()
-    signals = extract_signals(system2_output)
+async def orchestrate(in_process: bool = True):
+    # Stages run inside this interpreter unless in_process is False, which
+    # spawns one interpreter per stage for debugging
+    signals = await run_system2(in_process)
 
     if not signals:
         raise RuntimeError("No awareness signals extracted from System 2")
 
-    system1_output = await run_system1(signals)
+    system1_output = await run_system1(signals, in_process)
 
     return {
         "signals_used": len(signals),
@@ -134,5 +402,6 @@ if __name__ == "__main__":
     )
 
     if "--run" in sys.argv:
-        result = asyncio.run(orchestrate())
+        isolated = "--isolated" in sys.argv
+        result = asyncio.run(orchestrate(in_process=not isolated))
         print(json.dumps(result, indent=2))
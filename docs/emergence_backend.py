@@ -7,24 +7,50 @@ Tracks all agent lifecycle events with full governance layer
 import asyncio
 import time
 import json
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Optional
+import random
+import dataclasses
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Deque, List, Dict, Optional, Tuple
 from pathlib import Path
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj as indented JSON, via orjson when it is installed"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with path.open('w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def json_line(obj) -> bytes:
+    """Encode obj as one JSON Lines record"""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj).encode() + b'\n'
+
+
 # ============================================================================
 # CORE AWARENESS STRUCTURES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AwarenessState:
     coherence: float
     uncertainty: float
-    field: Dict[str, float] = field(default_factory=dict)
-    timestamp: float = field(default_factory=time.time)
+    field: Dict[str, float] = dataclasses.field(default_factory=dict)
+    timestamp: float = dataclasses.field(default_factory=time.time)
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     id: int
     x: float
@@ -65,25 +91,30 @@ class Invariants:
         self.active_count = 0
         self.violations = []
     
-    def enforce(self, awareness: AwarenessState, depth: int = 0):
-        """Enforce all invariants on awareness state"""
-        if awareness.uncertainty > self.MAX_UNCERTAINTY:
-            violation = f"uncertainty_exceeded: {awareness.uncertainty:.3f} > {self.MAX_UNCERTAINTY}"
-            self.violations.append(violation)
-            raise InvariantViolation(violation)
+    def check_scalar(self, coherence: float, uncertainty: float, depth: int = 0) -> Tuple[bool, str]:
+        """Check all invariants on raw scalars, return (ok, reason)"""
+        if uncertainty > self.MAX_UNCERTAINTY:
+            return False, f"uncertainty_exceeded: {uncertainty:.3f} > {self.MAX_UNCERTAINTY}"
         
-        if awareness.coherence < self.MIN_COHERENCE:
-            violation = f"coherence_collapsed: {awareness.coherence:.3f} < {self.MIN_COHERENCE}"
-            self.violations.append(violation)
-            raise InvariantViolation(violation)
+        if coherence < self.MIN_COHERENCE:
+            return False, f"coherence_collapsed: {coherence:.3f} < {self.MIN_COHERENCE}"
         
         if depth > self.MAX_DEPTH:
-            violation = f"recursion_exceeded: {depth} > {self.MAX_DEPTH}"
-            self.violations.append(violation)
-            raise InvariantViolation(violation)
+            return False, f"recursion_exceeded: {depth} > {self.MAX_DEPTH}"
         
         if self.active_count >= self.MAX_AGENTS:
-            violation = f"population_exceeded: {self.active_count} >= {self.MAX_AGENTS}"
+            return False, f"population_exceeded: {self.active_count} >= {self.MAX_AGENTS}"
+        
+        return True, ''
+    
+    def enforce(self, awareness: AwarenessState, depth: int = 0):
+        """Enforce all invariants on awareness state"""
+        self.enforce_scalar(awareness.coherence, awareness.uncertainty, depth)
+    
+    def enforce_scalar(self, coherence: float, uncertainty: float, depth: int = 0):
+        """Enforce all invariants on raw scalars"""
+        ok, violation = self.check_scalar(coherence, uncertainty, depth)
+        if not ok:
             self.violations.append(violation)
             raise InvariantViolation(violation)
     
@@ -97,13 +128,20 @@ class Invariants:
 class Ethics:
     def validate(self, awareness: AwarenessState):
         """Validate ethical constraints"""
-        risk = awareness.field.get('risk', 0.0)
-        stability = awareness.field.get('stability', 1.0)
-        
-        if awareness.coherence <= 0.0:
+        return self.validate_scalar(
+            awareness.coherence,
+            awareness.uncertainty,
+            awareness.field.get('risk', 0.0),
+            awareness.field.get('stability', 1.0),
+        )
+    
+    def validate_scalar(self, coherence: float, uncertainty: float,
+                        risk: float, stability: float):
+        """Validate ethical constraints on raw scalars"""
+        if coherence <= 0.0:
             raise Exception("action_from_zero_coherence")
         
-        if awareness.uncertainty >= 1.0:
+        if uncertainty >= 1.0:
             raise Exception("action_from_total_uncertainty")
         
         if risk > 0.9 and stability < 0.1:
@@ -116,136 +154,249 @@ class Ethics:
 # EMERGENCE SIMULATION
 # ============================================================================
 
+FIELD_KEYS = ('novelty', 'complexity', 'risk', 'stability')
+
+
+def awareness_field(coherence: float, uncertainty: float) -> Tuple[float, float, float, float]:
+    """Field dynamics for one state, in FIELD_KEYS order"""
+    return (
+        (1 - uncertainty) * 0.7,
+        coherence * 0.6,
+        uncertainty * (1 - coherence),
+        coherence - (coherence * uncertainty),
+    )
+
+
+# Event type ids; names are only attached when events leave the simulation
+EVT_SPAWN, EVT_DISSOLVE, EVT_VIOLATION, EVT_ACTIVE = range(4)
+EVT_NAMES = ('spawn', 'dissolve', 'violation', 'active')
+
+
+def _step_kernel(n: int, coherence: List[float], uncertainty: List[float], ages: List[int],
+                 max_age: int, rand_buf: List[float],
+                 max_u: float, min_c: float) -> List[bool]:
+    """Advance the first n agent rows in place, return the dissolve mask"""
+    mask = []
+    for i in range(n):
+        age = ages[i] + 1
+        ages[i] = age
+        
+        c = coherence[i] + (rand_buf[2 * i] - 0.5) * 0.02
+        u = uncertainty[i] + (rand_buf[2 * i + 1] - 0.5) * 0.02
+        c = max(0.0, min(1.0, c))
+        u = max(0.0, min(1.0, u))
+        coherence[i] = c
+        uncertainty[i] = u
+        
+        mask.append(u > max_u or c < min_c or age >= max_age)
+    return mask
+
+
 class EmergenceSimulation:
-    def __init__(self):
-        self.agents: List[Agent] = []
-        self.events: List[Dict] = []
+    AGENT_MAX_AGE = 500
+    EVENT_CAP = 10000
+    
+    def __init__(self, seed: Optional[int] = None, event_log: Optional[Path] = None):
+        # Struct-of-arrays agent storage preallocated to the population
+        # cap: rows [0, n_active) of every column are the live agents
+        capacity = Invariants.MAX_AGENTS
+        self.ids: List[int] = [0] * capacity
+        self.xs: List[float] = [0.0] * capacity
+        self.ys: List[float] = [0.0] * capacity
+        self.coherence: List[float] = [0.0] * capacity
+        self.uncertainty: List[float] = [0.0] * capacity
+        self.ages: List[int] = [0] * capacity
+        self.states: List[str] = [''] * capacity
+        self.n_active = 0
+        
+        # Private generator, bound once so steps are reproducible per seed
+        self.rng = random.Random(seed)
+        
+        # Recent events stay in memory; the full history is streamed
+        # to event_log as JSON Lines when one is given
+        self.events: Deque[Tuple] = deque(maxlen=self.EVENT_CAP)
+        self.event_stream = event_log.open('wb') if event_log else None
         self.invariants = Invariants()
         self.ethics = Ethics()
         self.agent_id_counter = 0
         self.spawn_count = 0
         self.dissolve_count = 0
         self.violation_count = 0
+        self.active_state_count = 0
+    
+    @property
+    def agents(self) -> List[Agent]:
+        """Materialized view of live agents"""
+        return [self.agent(i) for i in range(self.n_active)]
+    
+    def agent(self, i: int) -> Agent:
+        return Agent(
+            id=self.ids[i],
+            x=self.xs[i],
+            y=self.ys[i],
+            coherence=self.coherence[i],
+            uncertainty=self.uncertainty[i],
+            age=self.ages[i],
+            max_age=self.AGENT_MAX_AGE,
+            state=self.states[i],
+        )
+    
+    def agent_dict(self, i: int) -> Dict:
+        return {
+            'id': self.ids[i],
+            'x': self.xs[i],
+            'y': self.ys[i],
+            'coherence': self.coherence[i],
+            'uncertainty': self.uncertainty[i],
+            'age': self.ages[i],
+            'state': self.states[i]
+        }
     
     def create_awareness(self, coherence: float, uncertainty: float) -> AwarenessState:
         """Create awareness state with field dynamics"""
-        field = {
-            'novelty': (1 - uncertainty) * 0.7,
-            'complexity': coherence * 0.6,
-            'risk': uncertainty * (1 - coherence),
-            'stability': coherence - (coherence * uncertainty),
-        }
+        field = dict(zip(FIELD_KEYS, awareness_field(coherence, uncertainty)))
         return AwarenessState(coherence, uncertainty, field)
     
-    def spawn_agent(self, x: float, y: float) -> Optional[Agent]:
+    def spawn_agent(self, x: float, y: float, now: Optional[float] = None) -> Optional[Agent]:
         """Spawn new agent with governance checks"""
         try:
-            coherence = 0.3 + (0.5 * (1 - (len(self.agents) / self.invariants.MAX_AGENTS)))
-            uncertainty = 0.2 + (0.4 * (len(self.agents) / self.invariants.MAX_AGENTS))
-            
-            awareness = self.create_awareness(coherence, uncertainty)
+            n = self.n_active
+            coherence = 0.3 + (0.5 * (1 - (n / self.invariants.MAX_AGENTS)))
+            uncertainty = 0.2 + (0.4 * (n / self.invariants.MAX_AGENTS))
             
-            # Governance checks
-            self.invariants.enforce(awareness, depth=0)
-            self.ethics.validate(awareness)
+            # Governance checks, run on scalars so no field dict is built
+            _, _, risk, stability = awareness_field(coherence, uncertainty)
+            self.invariants.enforce_scalar(coherence, uncertainty, depth=0)
+            self.ethics.validate_scalar(coherence, uncertainty, risk, stability)
             
-            agent = Agent(
-                id=self.agent_id_counter,
-                x=x,
-                y=y,
-                coherence=coherence,
-                uncertainty=uncertainty
-            )
+            self.ids[n] = self.agent_id_counter
+            self.xs[n] = x
+            self.ys[n] = y
+            self.coherence[n] = coherence
+            self.uncertainty[n] = uncertainty
+            self.ages[n] = 0
+            self.states[n] = 'spawning'
+            self.n_active = n + 1
             
             self.agent_id_counter += 1
-            self.agents.append(agent)
             self.invariants.register_spawn()
             self.spawn_count += 1
             
-            self.log_event('spawn', f'Agent {agent.id} spawned', agent.to_dict())
+            self.log_event(EVT_SPAWN, f'Agent {self.ids[n]} spawned', self.agent_dict(n), now)
             
-            return agent
+            return self.agent(n)
         
         except InvariantViolation as e:
             self.violation_count += 1
-            self.log_event('violation', str(e), {'type': 'spawn_blocked'})
+            self.log_event(EVT_VIOLATION, str(e), {'type': 'spawn_blocked'}, now)
             return None
     
-    def update_agent(self, agent: Agent) -> bool:
-        """Update agent state, return True if should be dissolved"""
-        agent.age += 1
-        
-        # Awareness dynamics
-        import random
-        agent.coherence += (random.random() - 0.5) * 0.02
-        agent.uncertainty += (random.random() - 0.5) * 0.02
-        
-        agent.coherence = max(0.0, min(1.0, agent.coherence))
-        agent.uncertainty = max(0.0, min(1.0, agent.uncertainty))
-        
-        # Check for violations
-        try:
-            awareness = self.create_awareness(agent.coherence, agent.uncertainty)
-            self.invariants.enforce(awareness, depth=0)
-        except InvariantViolation as e:
-            self.violation_count += 1
-            self.log_event('violation', f'Agent {agent.id}: {str(e)}', agent.to_dict())
-            return True
-        
-        # Natural dissolution
-        if agent.age >= agent.max_age:
-            return True
+    def update_agent(self, i: int, flagged: bool, now: Optional[float] = None) -> bool:
+        """Apply governance to row i after the kernel ran, return True if it should be dissolved"""
+        if flagged:
+            # Check for violations
+            ok, violation = self.invariants.check_scalar(self.coherence[i], self.uncertainty[i])
+            if not ok:
+                self.invariants.violations.append(violation)
+                self.violation_count += 1
+                self.log_event(EVT_VIOLATION, f'Agent {self.ids[i]}: {violation}', self.agent_dict(i), now)
+                return True
+            
+            # Natural dissolution
+            return self.ages[i] >= self.AGENT_MAX_AGE
         
         # State transitions
-        if agent.state == 'spawning' and agent.age > 50:
-            agent.state = 'active'
-            self.log_event('active', f'Agent {agent.id} matured', agent.to_dict())
+        if self.states[i] == 'spawning' and self.ages[i] > 50:
+            self.states[i] = 'active'
+            self.active_state_count += 1
+            self.log_event(EVT_ACTIVE, f'Agent {self.ids[i]} matured', self.agent_dict(i), now)
         
         return False
     
-    def dissolve_agent(self, agent: Agent):
-        """Dissolve agent and log residue"""
-        self.agents.remove(agent)
-        self.invariants.register_dissolution()
-        self.dissolve_count += 1
-        
+    def dissolve_agent(self, i: int, now: Optional[float] = None):
+        """Dissolve agent row i and log residue"""
         residue = {
-            'id': agent.id,
-            'final_coherence': agent.coherence,
-            'final_uncertainty': agent.uncertainty,
-            'age': agent.age,
+            'id': self.ids[i],
+            'final_coherence': self.coherence[i],
+            'final_uncertainty': self.uncertainty[i],
+            'age': self.ages[i],
         }
         
-        self.log_event('dissolve', f'Agent {agent.id} dissolved', residue)
+        if self.states[i] == 'active':
+            self.active_state_count -= 1
+        
+        # Swap-pop: move the last live row into the vacated slot
+        last = self.n_active - 1
+        for column in (self.ids, self.xs, self.ys, self.coherence,
+                       self.uncertainty, self.ages, self.states):
+            column[i] = column[last]
+        self.n_active = last
+        
+        self.invariants.register_dissolution()
+        self.dissolve_count += 1
+        
+        self.log_event(EVT_DISSOLVE, f'Agent {residue["id"]} dissolved', residue, now)
     
     def step(self):
         """Single simulation step"""
-        to_dissolve = []
+        # One clock read stamps every event logged during this step
+        now = time.time()
+        
+        n = self.n_active
+        rand = self.rng.random
+        rand_buf = [rand() for _ in range(2 * n)]
+        mask = _step_kernel(n, self.coherence, self.uncertainty, self.ages,
+                            self.AGENT_MAX_AGE, rand_buf,
+                            self.invariants.MAX_UNCERTAINTY, self.invariants.MIN_COHERENCE)
+        
+        # A full population fails check_scalar() for every agent
+        if self.invariants.active_count >= self.invariants.MAX_AGENTS:
+            mask = [True] * n
         
-        for agent in self.agents:
-            should_dissolve = self.update_agent(agent)
-            if should_dissolve:
-                to_dissolve.append(agent)
+        update = self.update_agent
+        to_dissolve = [i for i in range(n) if update(i, mask[i], now)]
         
-        for agent in to_dissolve:
-            self.dissolve_agent(agent)
+        # Highest row first, so swapped-in rows are always survivors
+        for i in reversed(to_dissolve):
+            self.dissolve_agent(i, now)
     
-    def log_event(self, event_type: str, message: str, data: Optional[Dict] = None):
-        """Log event with timestamp"""
-        event = {
-            'timestamp': time.time(),
-            'type': event_type,
+    def log_event(self, event_type: int, message: str, data: Optional[Dict] = None,
+                  now: Optional[float] = None):
+        """Log event as a (timestamp, type id, message, data) tuple"""
+        event = (time.time() if now is None else now, event_type, message, data or {})
+        self.events.append(event)
+        if self.event_stream:
+            self.event_stream.write(json_line(self.event_dict(event)))
+    
+    @staticmethod
+    def event_dict(event: Tuple) -> Dict:
+        """Expand an event tuple into its serialized form"""
+        timestamp, event_type, message, data = event
+        return {
+            'timestamp': timestamp,
+            'type': EVT_NAMES[event_type],
             'message': message,
-            'data': data or {}
+            'data': data
         }
-        self.events.append(event)
+    
+    def close(self):
+        """Flush and close the event stream"""
+        if self.event_stream:
+            self.event_stream.close()
+            self.event_stream = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
     
     def get_state(self) -> Dict:
         """Get current simulation state"""
         return {
-            'agents': [agent.to_dict() for agent in self.agents],
+            'agents': [self.agent_dict(i) for i in range(self.n_active)],
             'stats': {
-                'active_count': len([a for a in self.agents if a.state == 'active']),
+                'active_count': self.active_state_count,
                 'spawn_count': self.spawn_count,
                 'dissolve_count': self.dissolve_count,
                 'violation_count': self.violation_count,
@@ -260,77 +411,81 @@ class EmergenceSimulation:
     
     def get_events(self, last_n: Optional[int] = None) -> List[Dict]:
         """Get recent events"""
+        events = self.events
         if last_n:
-            return self.events[-last_n:]
-        return self.events
+            events = islice(events, max(0, len(events) - last_n), None)
+        return [self.event_dict(event) for event in events]
 
 
 # ============================================================================
 # SIMULATION RUNNER
 # ============================================================================
 
-async def run_simulation(steps: int = 1000, spawn_every: int = 60):
+async def run_simulation(steps: int = 1000, spawn_every: int = 60, seed: Optional[int] = None,
+                         realtime: bool = False):
     """Run full emergence simulation"""
-    sim = EmergenceSimulation()
-    
-    print("=" * 70)
-    print("9DA MULTI-AGENT EMERGENCE SIMULATION")
-    print("=" * 70)
-    
-    # Initial spawns
-    import random
-    for i in range(3):
-        x = random.uniform(50, 750)
-        y = random.uniform(50, 550)
-        sim.spawn_agent(x, y)
-    
-    for step in range(steps):
-        sim.step()
+    event_file = Path('emergence_log.jsonl')
+    # Closing the simulation flushes the event stream, even on error
+    with EmergenceSimulation(seed=seed, event_log=event_file) as sim:
+        print("=" * 70)
+        print("9DA MULTI-AGENT EMERGENCE SIMULATION")
+        print("=" * 70)
         
-        # Periodic spawning
-        if step % spawn_every == 0 and len(sim.agents) < sim.invariants.MAX_AGENTS:
-            x = random.uniform(50, 750)
-            y = random.uniform(50, 550)
+        # Initial spawns
+        for i in range(3):
+            x = sim.rng.uniform(50, 750)
+            y = sim.rng.uniform(50, 550)
             sim.spawn_agent(x, y)
         
-        # Report every 100 steps
-        if step % 100 == 0:
-            state = sim.get_state()
-            print(f"\nStep {step}:")
-            print(f"  Active agents: {state['stats']['active_count']}")
-            print(f"  Total spawned: {state['stats']['spawn_count']}")
-            print(f"  Dissolved: {state['stats']['dissolve_count']}")
-            print(f"  Violations: {state['stats']['violation_count']}")
+        for step in range(steps):
+            sim.step()
             
-            if sim.agents:
-                avg_coherence = sum(a.coherence for a in sim.agents) / len(sim.agents)
-                avg_uncertainty = sum(a.uncertainty for a in sim.agents) / len(sim.agents)
-                print(f"  Avg coherence: {avg_coherence:.3f}")
-                print(f"  Avg uncertainty: {avg_uncertainty:.3f}")
+            # Periodic spawning
+            if step % spawn_every == 0 and sim.n_active < sim.invariants.MAX_AGENTS:
+                x = sim.rng.uniform(50, 750)
+                y = sim.rng.uniform(50, 550)
+                sim.spawn_agent(x, y)
+            
+            # Report every 100 steps
+            if step % 100 == 0:
+                state = sim.get_state()
+                print(f"\nStep {step}:")
+                print(f"  Active agents: {state['stats']['active_count']}")
+                print(f"  Total spawned: {state['stats']['spawn_count']}")
+                print(f"  Dissolved: {state['stats']['dissolve_count']}")
+                print(f"  Violations: {state['stats']['violation_count']}")
+                
+                if sim.n_active:
+                    avg_coherence = sum(sim.coherence[:sim.n_active]) / sim.n_active
+                    avg_uncertainty = sum(sim.uncertainty[:sim.n_active]) / sim.n_active
+                    print(f"  Avg coherence: {avg_coherence:.3f}")
+                    print(f"  Avg uncertainty: {avg_uncertainty:.3f}")
+            
+            # Pace to ~100 steps/sec only when watching live
+            if realtime:
+                await asyncio.sleep(0.01)
         
-        await asyncio.sleep(0.01)
-    
-    print("\n" + "=" * 70)
-    print("FINAL REPORT")
-    print("=" * 70)
-    
-    state = sim.get_state()
-    print(json.dumps(state['stats'], indent=2))
-    
-    print("\nRecent Events:")
-    for event in sim.get_events(last_n=10):
-        timestamp = time.strftime('%H:%M:%S', time.localtime(event['timestamp']))
-        print(f"[{timestamp}] {event['type'].upper()}: {event['message']}")
-    
-    # Save full log
+        print("\n" + "=" * 70)
+        print("FINAL REPORT")
+        print("=" * 70)
+        
+        state = sim.get_state()
+        print(json.dumps(state['stats'], indent=2))
+        
+        print("\nRecent Events:")
+        for event in sim.get_events(last_n=10):
+            timestamp = time.strftime('%H:%M:%S', time.localtime(event['timestamp']))
+            print(f"[{timestamp}] {event['type'].upper()}: {event['message']}")
+        
+    # Save final state; events were streamed as the run progressed
     output_file = Path('emergence_log.json')
-    with output_file.open('w') as f:
-        json.dump({
-            'final_state': sim.get_state(),
-            'events': sim.get_events(),
-        }, f, indent=2)
+    write_json(output_file, {
+        'final_state': sim.get_state(),
+        'event_log': str(event_file),
+    })
     
-    print(f"\nFull log saved to: {output_file}")
+    print(f"\nFinal state saved to: {output_file}")
+    print(f"Full event log saved to: {event_file}")
     
     return sim
 
@@ -342,8 +497,11 @@ async def run_simulation(steps: int = 1000, spawn_every: int = 60):
 if __name__ == '__main__':
     import sys
     
+    args = [arg for arg in sys.argv[1:] if arg != '--realtime']
+    realtime = '--realtime' in sys.argv[1:]
+    
     steps = 1000
-    if len(sys.argv) > 1:
-        steps = int(sys.argv[1])
+    if args:
+        steps = int(args[0])
     
-    asyncio.run(run_simulation(steps=steps))
+    asyncio.run(run_simulation(steps=steps, realtime=realtime))
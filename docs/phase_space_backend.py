@@ -6,15 +6,34 @@ Computes awareness trajectories and phase space dynamics
 
 import numpy as np
 import json
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Union
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 
 # ============================================================================
 # PHASE SPACE STRUCTURES
 # ============================================================================
 
+def _to_list(arr: np.ndarray, decimals: Optional[int] = None) -> List[float]:
+    """Array to floats for JSON, optionally quantized to a fixed number of decimals"""
+    if decimals is not None:
+        arr = np.round(arr, decimals)
+    return arr.ravel().tolist()
+
+
 @dataclass
 class PhasePoint:
     coherence: float
@@ -37,6 +56,150 @@ class PhasePoint:
         }
 
 
+class PhasePointBatch:
+    """Column-wise phase points with derived fields computed per array"""
+    
+    FIELDS = ('coherence', 'uncertainty', 'risk', 'stability', 'novelty', 'complexity')
+    
+    def __init__(self, coherence, uncertainty):
+        self.coherence = np.asarray(coherence, dtype=float)
+        self.uncertainty = np.asarray(uncertainty, dtype=float)
+        self.risk = self.uncertainty * (1 - self.coherence)
+        self.stability = self.coherence * (1 - self.uncertainty)
+        self.novelty = (1 - self.uncertainty) * 0.7
+        self.complexity = self.coherence * 0.6
+    
+    @classmethod
+    def from_points(cls, points: List[PhasePoint]) -> 'PhasePointBatch':
+        return cls([p.coherence for p in points], [p.uncertainty for p in points])
+    
+    def as_points(self) -> List[PhasePoint]:
+        """Materialize PhasePoint objects, for callers that need them"""
+        return [PhasePoint(c, u) for c, u in zip(self.coherence.tolist(), self.uncertainty.tolist())]
+    
+    def __len__(self):
+        return len(self.coherence)
+    
+    def stack(self, *names: str) -> np.ndarray:
+        """Named columns as rows of one (k, N) array"""
+        return np.stack([getattr(self, name) for name in names])
+    
+    def record(self, i: int) -> Dict:
+        """Point i as a PhasePoint.to_dict-style record"""
+        return {name: getattr(self, name)[i].item() for name in self.FIELDS}
+    
+    def to_columns(self, decimals: Optional[int] = None) -> Dict[str, List[float]]:
+        return {name: _to_list(getattr(self, name), decimals) for name in self.FIELDS}
+    
+    def to_records(self, decimals: Optional[int] = None) -> List[Dict]:
+        """Per-point dicts, matching PhasePoint.to_dict"""
+        columns = self.to_columns(decimals)
+        return [dict(zip(self.FIELDS, row)) for row in zip(*columns.values())]
+
+
+# ============================================================================
+# TRAJECTORY KERNEL
+# ============================================================================
+
+def _evolve_path(c0, u0, draws):
+    """evolve() recurrence over pre-drawn (steps, 3) noise; scalar-only for Numba"""
+    n = draws.shape[0]
+    path = np.empty((n + 1, 2))
+    path[0, 0] = c0
+    path[0, 1] = u0
+    
+    c, u = c0, u0
+    for i in range(n):
+        c = min(1.0, max(0.0, c + draws[i, 0] + draws[i, 1] - u * 0.01))
+        u = min(1.0, max(0.0, u + draws[i, 2]))
+        path[i + 1, 0] = c
+        path[i + 1, 1] = u
+    
+    return path
+
+
+def _converge_stats(c0s, u0s, draws, window):
+    """Final point and variance over the last `window` points for each start
+    
+    Runs the _evolve_path recurrence on (n, steps, 3) noise without keeping
+    the paths; rows of the (n, 4) result are (c, u, var_c, var_u).
+    """
+    n, steps = draws.shape[0], draws.shape[1]
+    out = np.empty((n, 4))
+    first = max(0, steps + 1 - window)
+    
+    for i in prange(n):
+        c, u = c0s[i], u0s[i]
+        count = 0
+        mean_c = m2_c = mean_u = m2_u = 0.0
+        for t in range(steps + 1):
+            if t > 0:
+                c = min(1.0, max(0.0, c + draws[i, t - 1, 0] + draws[i, t - 1, 1] - u * 0.01))
+                u = min(1.0, max(0.0, u + draws[i, t - 1, 2]))
+            if t >= first:
+                # Welford update over the trailing window
+                count += 1
+                dc = c - mean_c
+                mean_c += dc / count
+                m2_c += dc * (c - mean_c)
+                du = u - mean_u
+                mean_u += du / count
+                m2_u += du * (u - mean_u)
+        out[i, 0] = c
+        out[i, 1] = u
+        out[i, 2] = m2_c / count
+        out[i, 3] = m2_u / count
+    
+    return out
+
+
+def _converge_stats_lockstep(c0s, u0s, draws, window):
+    """_converge_stats with every sample advanced together by array ops"""
+    n, steps = draws.shape[0], draws.shape[1]
+    first = max(0, steps + 1 - window)
+    # (steps, 3, n): each step's drift/noise rows are contiguous across samples
+    lanes = np.ascontiguousarray(draws.transpose(1, 2, 0))
+    tail_c = np.empty((steps + 1 - first, n))
+    tail_u = np.empty((steps + 1 - first, n))
+    
+    c, u = c0s.copy(), u0s.copy()
+    if first == 0:
+        tail_c[0], tail_u[0] = c, u
+    for t in range(1, steps + 1):
+        drift, c_noise, u_noise = lanes[t - 1]
+        c = np.clip(c + drift + c_noise - u * 0.01, 0.0, 1.0)
+        u = np.clip(u + u_noise, 0.0, 1.0)
+        if t >= first:
+            tail_c[t - first], tail_u[t - first] = c, u
+    
+    return np.column_stack([c, u, tail_c.var(axis=0), tail_u.var(axis=0)])
+
+
+@lru_cache(maxsize=8)
+def _centred_steps(n: int) -> np.ndarray:
+    """0..n-1 shifted to zero mean; cached read-only, trajectories share lengths"""
+    x = np.arange(n) - (n - 1) / 2
+    x.flags.writeable = False
+    return x
+
+
+def _linfit_slope(y):
+    """Least-squares slope of y (or of each row of y) against 0..N-1, in closed form"""
+    n = np.shape(y)[-1]
+    if n < 2:
+        return np.zeros(np.shape(y)[:-1]) if np.ndim(y) > 1 else 0.0
+    # Centred x keeps the dot product well conditioned; sum(x^2) is exact
+    return np.dot(y, _centred_steps(n)) / (n * (n * n - 1) / 12)
+
+
+if njit is not None:
+    _evolve_path = njit(cache=True)(_evolve_path)
+    _converge_stats = njit(cache=True, parallel=True)(_converge_stats)
+else:
+    # Interpreted, one vector op per step beats one scalar loop per sample
+    _converge_stats = _converge_stats_lockstep
+
+
 # ============================================================================
 # DYNAMICS ENGINE
 # ============================================================================
@@ -47,20 +210,27 @@ class AwarenessDynamics:
     MAX_UNCERTAINTY = 0.85
     MIN_COHERENCE = 0.15
     
-    def __init__(self, drift_rate: float = 0.02, noise_level: float = 0.01):
+    def __init__(self, drift_rate: float = 0.02, noise_level: float = 0.01,
+                 seed: Optional[Union[int, np.random.Generator]] = None):
         self.drift_rate = drift_rate
         self.noise_level = noise_level
+        # A drift draw beyond this counts as a significant drift event
+        self._drift_thr = drift_rate * 1.5
+        # PCG64 generator; passing a Generator shares its stream
+        self.rng = np.random.default_rng(seed)
         self.violations = []
         self.drift_events = []
     
     def evolve(self, point: PhasePoint) -> PhasePoint:
         """Compute next state using awareness dynamics"""
+        drift_draw, coherence_draw, uncertainty_draw = self.rng.standard_normal(3).tolist()
+        
         # Drift component (systematic change)
-        coherence_drift = np.random.randn() * self.drift_rate
+        coherence_drift = drift_draw * self.drift_rate
         
         # Noise component (random fluctuation)
-        coherence_noise = np.random.randn() * self.noise_level
-        uncertainty_noise = np.random.randn() * self.noise_level
+        coherence_noise = coherence_draw * self.noise_level
+        uncertainty_noise = uncertainty_draw * self.noise_level
         
         # Coupling: high uncertainty inhibits coherence increase
         coupling_effect = -point.uncertainty * 0.01
@@ -74,7 +244,7 @@ class AwarenessDynamics:
         new_uncertainty = np.clip(new_uncertainty, 0.0, 1.0)
         
         # Track significant drift
-        if abs(coherence_drift) > self.drift_rate * 1.5:
+        if abs(coherence_drift) > self._drift_thr:
             self.drift_events.append({
                 'from': point.to_dict(),
                 'drift': coherence_drift
@@ -90,61 +260,91 @@ class AwarenessDynamics:
     
     def compute_trajectory(self, start: PhasePoint, steps: int) -> List[PhasePoint]:
         """Compute full trajectory from initial conditions"""
-        trajectory = [start]
-        current = start
+        return [start] + self.compute_batch(start, steps).as_points()[1:]
+    
+    def compute_batch(self, start: PhasePoint, steps: int) -> PhasePointBatch:
+        """Compute full trajectory as columns, without per-step PhasePoints"""
+        # One draw for the whole run, in evolve()'s order: drift, coherence
+        # noise, uncertainty noise
+        scales = np.array([self.drift_rate, self.noise_level, self.noise_level])
+        draws = self.rng.standard_normal((steps, 3)) * scales
         
-        for _ in range(steps):
-            current = self.evolve(current)
-            trajectory.append(current)
+        path = _evolve_path(float(start.coherence), float(start.uncertainty), draws)
+        batch = PhasePointBatch(path[:, 0], path[:, 1])
         
-        return trajectory
+        # Event records are only built for the flagged steps, reading the
+        # batch's risk/stability columns rather than deriving them again
+        drifted = np.flatnonzero(np.abs(draws[:, 0]) > self._drift_thr)
+        for i in drifted.tolist():
+            self.drift_events.append({
+                'from': batch.record(i),
+                'drift': float(draws[i, 0])
+            })
+        violated = np.flatnonzero(
+            (batch.uncertainty[1:] > self.MAX_UNCERTAINTY)
+            | (batch.coherence[1:] < self.MIN_COHERENCE)
+        )
+        for i in violated.tolist():
+            self.violations.append(batch.record(i + 1))
+        
+        return batch
+    
+    def compute_trajectory_array(self, start: PhasePoint, steps: int) -> np.ndarray:
+        """Run the evolve() recurrence over pre-drawn noise; returns (steps + 1, 2)"""
+        batch = self.compute_batch(start, steps)
+        return np.column_stack([batch.coherence, batch.uncertainty])
     
-    def analyze_trajectory(self, trajectory: List[PhasePoint]) -> Dict:
+    def analyze_trajectory(self, trajectory: Union[List[PhasePoint], PhasePointBatch]) -> Dict:
         """Analyze trajectory statistics"""
-        coherences = [p.coherence for p in trajectory]
-        uncertainties = [p.uncertainty for p in trajectory]
-        risks = [p.risk for p in trajectory]
-        stabilities = [p.stability for p in trajectory]
+        if not isinstance(trajectory, PhasePointBatch):
+            trajectory = PhasePointBatch.from_points(trajectory)
+        
+        # One (4, N) block, a contiguous row per quantity: coherence,
+        # uncertainty, risk, stability; each reduction is one sweep
+        arr = trajectory.stack('coherence', 'uncertainty', 'risk', 'stability')
+        means = arr.mean(axis=1)
+        mins = arr.min(axis=1)
+        maxs = arr.max(axis=1)
+        stds = arr[:2].std(axis=1)
         
         # Compute trends
-        coherence_trend = np.polyfit(range(len(coherences)), coherences, 1)[0]
-        uncertainty_trend = np.polyfit(range(len(uncertainties)), uncertainties, 1)[0]
+        coherence_trend, uncertainty_trend = _linfit_slope(arr[:2])
         
         # Find critical points
-        max_risk_idx = np.argmax(risks)
-        min_stability_idx = np.argmin(stabilities)
+        max_risk_idx = arr[2].argmax()
+        min_stability_idx = arr[3].argmin()
         
         return {
             'length': len(trajectory),
             'statistics': {
                 'coherence': {
-                    'mean': float(np.mean(coherences)),
-                    'std': float(np.std(coherences)),
-                    'min': float(np.min(coherences)),
-                    'max': float(np.max(coherences)),
+                    'mean': float(means[0]),
+                    'std': float(stds[0]),
+                    'min': float(mins[0]),
+                    'max': float(maxs[0]),
                     'trend': float(coherence_trend),
                 },
                 'uncertainty': {
-                    'mean': float(np.mean(uncertainties)),
-                    'std': float(np.std(uncertainties)),
-                    'min': float(np.min(uncertainties)),
-                    'max': float(np.max(uncertainties)),
+                    'mean': float(means[1]),
+                    'std': float(stds[1]),
+                    'min': float(mins[1]),
+                    'max': float(maxs[1]),
                     'trend': float(uncertainty_trend),
                 },
                 'risk': {
-                    'mean': float(np.mean(risks)),
-                    'max': float(np.max(risks)),
+                    'mean': float(means[2]),
+                    'max': float(maxs[2]),
                     'max_at_step': int(max_risk_idx),
                 },
                 'stability': {
-                    'mean': float(np.mean(stabilities)),
-                    'min': float(np.min(stabilities)),
+                    'mean': float(means[3]),
+                    'min': float(mins[3]),
                     'min_at_step': int(min_stability_idx),
                 },
             },
             'drift_events': len(self.drift_events),
             'violations': len(self.violations),
-            'final_state': trajectory[-1].to_dict(),
+            'final_state': trajectory.record(-1),
         }
 
 
@@ -155,70 +355,137 @@ class AwarenessDynamics:
 class PhasePortrait:
     """Generates full phase space portraits"""
     
-    def __init__(self):
-        self.dynamics = AwarenessDynamics()
+    def __init__(self, seed: Optional[Union[int, np.random.Generator]] = None):
+        self.rng = np.random.default_rng(seed)
+        self.dynamics = AwarenessDynamics(seed=self.rng)
     
-    def generate_vector_field(self, resolution: int = 20) -> Dict:
-        """Generate vector field showing flow directions"""
-        coherence_grid = np.linspace(0, 1, resolution)
-        uncertainty_grid = np.linspace(0, 1, resolution)
+    def generate_vector_field(self, resolution: int = 20, decimals: Optional[int] = None) -> Dict:
+        """Generate vector field showing flow directions, one column per quantity"""
+        # Coherence down the rows, uncertainty across the columns
+        c = np.linspace(0, 1, resolution).reshape(-1, 1)
+        u = np.linspace(0, 1, resolution).reshape(1, -1)
         
-        vectors = []
+        # One evolve() step for every cell at once, drawing in the same
+        # cell order and per-cell order as the scalar loop did
+        dynamics = self.dynamics
+        draws = self.rng.standard_normal((resolution, resolution, 3))
+        next_c = np.clip(
+            c + draws[..., 0] * dynamics.drift_rate + draws[..., 1] * dynamics.noise_level
+            + (-u * 0.01), 0.0, 1.0
+        )
+        next_u = np.clip(u + draws[..., 2] * dynamics.noise_level, 0.0, 1.0)
         
-        for c in coherence_grid:
-            for u in uncertainty_grid:
-                point = PhasePoint(c, u)
-                next_point = self.dynamics.evolve(point)
-                
-                dc = next_point.coherence - point.coherence
-                du = next_point.uncertainty - point.uncertainty
-                
-                vectors.append({
-                    'position': {'coherence': c, 'uncertainty': u},
-                    'velocity': {'d_coherence': dc, 'd_uncertainty': du},
-                    'magnitude': np.sqrt(dc**2 + du**2)
-                })
+        dc = next_c - c
+        du = next_u - u
+        magnitude = np.sqrt(dc**2 + du**2)
         
+        cs, us = np.broadcast_arrays(c, u)
         return {
             'resolution': resolution,
-            'vectors': vectors
+            'coherence': _to_list(cs, decimals),
+            'uncertainty': _to_list(us, decimals),
+            'd_coherence': _to_list(dc, decimals),
+            'd_uncertainty': _to_list(du, decimals),
+            'magnitude': _to_list(magnitude, decimals),
         }
     
     def find_attractors(self, n_samples: int = 50, steps: int = 100) -> List[Dict]:
         """Find stable attractors in phase space"""
-        # Sample random initial conditions
-        attractors = []
+        dynamics = AwarenessDynamics(drift_rate=0.01, noise_level=0.005)
+        scales = np.array([dynamics.drift_rate, dynamics.noise_level, dynamics.noise_level])
         
-        for _ in range(n_samples):
-            c0 = np.random.uniform(0.2, 0.9)
-            u0 = np.random.uniform(0.1, 0.7)
-            
-            dynamics = AwarenessDynamics(drift_rate=0.01, noise_level=0.005)
-            start = PhasePoint(c0, u0)
-            trajectory = dynamics.compute_trajectory(start, steps)
-            
-            # Check if trajectory converges
-            final_points = trajectory[-10:]
-            c_variance = np.var([p.coherence for p in final_points])
-            u_variance = np.var([p.uncertainty for p in final_points])
+        # Sample random initial conditions and every sample's noise up front
+        c0s = self.rng.uniform(0.2, 0.9, n_samples)
+        u0s = self.rng.uniform(0.1, 0.7, n_samples)
+        draws = self.rng.standard_normal((n_samples, steps, 3)) * scales
+        
+        # Samples are independent, so the kernel spreads them across cores;
+        # only each sample's final point and last-10 variance come back
+        stats = _converge_stats(c0s, u0s, draws, 10)
+        
+        # Check if trajectory converges
+        attractors = []
+        for i in range(n_samples):
+            c, u, c_variance, u_variance = stats[i].tolist()
             
             if c_variance < 0.001 and u_variance < 0.001:
-                final = trajectory[-1]
                 attractors.append({
-                    'coherence': final.coherence,
-                    'uncertainty': final.uncertainty,
-                    'basin_start': {'coherence': c0, 'uncertainty': u0},
+                    'coherence': c,
+                    'uncertainty': u,
+                    'basin_start': {'coherence': float(c0s[i]), 'uncertainty': float(u0s[i])},
                 })
         
         return attractors
 
 
+# ============================================================================
+# STREAMED JSON OUTPUT
+# ============================================================================
+
+class JsonObjectStream:
+    """Writes one top-level JSON object member by member; list members are streamed"""
+    
+    def __init__(self, f, indent: Optional[int] = 2):
+        self.f = f
+        self.indent = indent
+        self._members = 0
+        self._items = None
+        self.f.write('{')
+    
+    def _newline(self, depth: int) -> str:
+        if self.indent is None:
+            return ''
+        return '\n' + ' ' * (self.indent * depth)
+    
+    def _encode(self, value, depth: int) -> str:
+        # Same layout json.dump gives the value when nested at this depth;
+        # orjson covers the two layouts it supports, compact and 2-space
+        if orjson is not None and self.indent in (None, 2):
+            option = orjson.OPT_INDENT_2 if self.indent else 0
+            text = orjson.dumps(value, option=option).decode()
+        else:
+            text = json.dumps(value, indent=self.indent)
+        return text.replace('\n', self._newline(depth))
+    
+    def _key(self, key: str):
+        sep = ',' if self._members else ''
+        self.f.write(f"{sep}{self._newline(1)}{json.dumps(key)}: ")
+        self._members += 1
+    
+    def member(self, key: str, value):
+        self._key(key)
+        self.f.write(self._encode(value, 1))
+    
+    def begin_list(self, key: str):
+        self._key(key)
+        self.f.write('[')
+        self._items = 0
+    
+    def append(self, item):
+        sep = ',' if self._items else ''
+        self.f.write(f"{sep}{self._newline(2)}{self._encode(item, 2)}")
+        self._items += 1
+    
+    def end_list(self):
+        self.f.write((self._newline(1) if self._items else '') + ']')
+        self._items = None
+    
+    def close(self):
+        self.f.write(self._newline(0) + '}')
+
+
 # ============================================================================
 # SCENARIO EXPLORER
 # ============================================================================
 
-def explore_scenarios():
-    """Explore multiple initial conditions"""
+def explore_scenarios(seed: Optional[int] = None, indent: Optional[int] = 2,
+                      decimals: Optional[int] = None):
+    """Explore multiple initial conditions
+    
+    decimals, when set, quantizes the exported trajectory and vector-field
+    columns; statistics are always computed at full precision.
+    """
+    rng = np.random.default_rng(seed)
     
     scenarios = [
         ("High Uncertainty", 0.48, 0.72),
@@ -232,86 +499,86 @@ def explore_scenarios():
     print("9DA PHASE SPACE ANALYSIS")
     print("=" * 70)
     
-    results = []
-    
-    for name, c0, u0 in scenarios:
-        print(f"\n{'─' * 70}")
-        print(f"Scenario: {name}")
-        print(f"Initial: C={c0:.2f}, U={u0:.2f}")
-        print(f"{'─' * 70}")
-        
-        dynamics = AwarenessDynamics(drift_rate=0.02, noise_level=0.01)
-        start = PhasePoint(c0, u0)
-        trajectory = dynamics.compute_trajectory(start, steps=200)
+    output_file = Path('phase_space_analysis.json')
+    with output_file.open('w') as f:
+        output = JsonObjectStream(f, indent)
+        output.begin_list('scenarios')
         
-        analysis = dynamics.analyze_trajectory(trajectory)
+        for name, c0, u0 in scenarios:
+            print(f"\n{'─' * 70}")
+            print(f"Scenario: {name}")
+            print(f"Initial: C={c0:.2f}, U={u0:.2f}")
+            print(f"{'─' * 70}")
+            
+            dynamics = AwarenessDynamics(drift_rate=0.02, noise_level=0.01, seed=rng)
+            start = PhasePoint(c0, u0)
+            trajectory = dynamics.compute_batch(start, steps=200)
+            
+            analysis = dynamics.analyze_trajectory(trajectory)
+            
+            print(f"\nTrajectory Analysis:")
+            print(f"  Length: {analysis['length']} steps")
+            print(f"  Drift events: {analysis['drift_events']}")
+            print(f"  Violations: {analysis['violations']}")
+            
+            print(f"\nCoherence:")
+            print(f"  Mean: {analysis['statistics']['coherence']['mean']:.3f}")
+            print(f"  Range: [{analysis['statistics']['coherence']['min']:.3f}, "
+                  f"{analysis['statistics']['coherence']['max']:.3f}]")
+            print(f"  Trend: {analysis['statistics']['coherence']['trend']:+.4f}/step")
+            
+            print(f"\nUncertainty:")
+            print(f"  Mean: {analysis['statistics']['uncertainty']['mean']:.3f}")
+            print(f"  Range: [{analysis['statistics']['uncertainty']['min']:.3f}, "
+                  f"{analysis['statistics']['uncertainty']['max']:.3f}]")
+            print(f"  Trend: {analysis['statistics']['uncertainty']['trend']:+.4f}/step")
+            
+            print(f"\nRisk & Stability:")
+            print(f"  Mean risk: {analysis['statistics']['risk']['mean']:.3f}")
+            print(f"  Max risk: {analysis['statistics']['risk']['max']:.3f} "
+                  f"(step {analysis['statistics']['risk']['max_at_step']})")
+            print(f"  Mean stability: {analysis['statistics']['stability']['mean']:.3f}")
+            print(f"  Min stability: {analysis['statistics']['stability']['min']:.3f} "
+                  f"(step {analysis['statistics']['stability']['min_at_step']})")
+            
+            final = analysis['final_state']
+            print(f"\nFinal State:")
+            print(f"  Coherence: {final['coherence']:.3f}")
+            print(f"  Uncertainty: {final['uncertainty']:.3f}")
+            print(f"  Risk: {final['risk']:.3f}")
+            print(f"  Stability: {final['stability']:.3f}")
+            
+            # Written as soon as it completes; only one trajectory is held
+            output.append({
+                'name': name,
+                'initial': {'coherence': c0, 'uncertainty': u0},
+                'trajectory': trajectory.to_records(decimals),
+                'analysis': analysis,
+            })
         
-        print(f"\nTrajectory Analysis:")
-        print(f"  Length: {analysis['length']} steps")
-        print(f"  Drift events: {analysis['drift_events']}")
-        print(f"  Violations: {analysis['violations']}")
+        output.end_list()
         
-        print(f"\nCoherence:")
-        print(f"  Mean: {analysis['statistics']['coherence']['mean']:.3f}")
-        print(f"  Range: [{analysis['statistics']['coherence']['min']:.3f}, "
-              f"{analysis['statistics']['coherence']['max']:.3f}]")
-        print(f"  Trend: {analysis['statistics']['coherence']['trend']:+.4f}/step")
+        # Generate phase portrait
+        print(f"\n{'=' * 70}")
+        print("GENERATING PHASE PORTRAIT")
+        print("=" * 70)
         
-        print(f"\nUncertainty:")
-        print(f"  Mean: {analysis['statistics']['uncertainty']['mean']:.3f}")
-        print(f"  Range: [{analysis['statistics']['uncertainty']['min']:.3f}, "
-              f"{analysis['statistics']['uncertainty']['max']:.3f}]")
-        print(f"  Trend: {analysis['statistics']['uncertainty']['trend']:+.4f}/step")
+        portrait = PhasePortrait(seed=rng)
+        vector_field = portrait.generate_vector_field(resolution=15, decimals=decimals)
+        print(f"Vector field computed: {len(vector_field['magnitude'])} points")
         
-        print(f"\nRisk & Stability:")
-        print(f"  Mean risk: {analysis['statistics']['risk']['mean']:.3f}")
-        print(f"  Max risk: {analysis['statistics']['risk']['max']:.3f} "
-              f"(step {analysis['statistics']['risk']['max_at_step']})")
-        print(f"  Mean stability: {analysis['statistics']['stability']['mean']:.3f}")
-        print(f"  Min stability: {analysis['statistics']['stability']['min']:.3f} "
-              f"(step {analysis['statistics']['stability']['min_at_step']})")
+        attractors = portrait.find_attractors(n_samples=30, steps=100)
+        print(f"Attractors found: {len(attractors)}")
         
-        final = analysis['final_state']
-        print(f"\nFinal State:")
-        print(f"  Coherence: {final['coherence']:.3f}")
-        print(f"  Uncertainty: {final['uncertainty']:.3f}")
-        print(f"  Risk: {final['risk']:.3f}")
-        print(f"  Stability: {final['stability']:.3f}")
+        if attractors:
+            print("\nAttractor locations:")
+            for i, attr in enumerate(attractors[:5], 1):
+                print(f"  {i}. C={attr['coherence']:.3f}, U={attr['uncertainty']:.3f}")
         
-        results.append({
-            'name': name,
-            'initial': {'coherence': c0, 'uncertainty': u0},
-            'trajectory': [p.to_dict() for p in trajectory],
-            'analysis': analysis,
-        })
-    
-    # Generate phase portrait
-    print(f"\n{'=' * 70}")
-    print("GENERATING PHASE PORTRAIT")
-    print("=" * 70)
-    
-    portrait = PhasePortrait()
-    vector_field = portrait.generate_vector_field(resolution=15)
-    print(f"Vector field computed: {len(vector_field['vectors'])} points")
-    
-    attractors = portrait.find_attractors(n_samples=30, steps=100)
-    print(f"Attractors found: {len(attractors)}")
-    
-    if attractors:
-        print("\nAttractor locations:")
-        for i, attr in enumerate(attractors[:5], 1):
-            print(f"  {i}. C={attr['coherence']:.3f}, U={attr['uncertainty']:.3f}")
-    
-    # Save results
-    output = {
-        'scenarios': results,
-        'vector_field': vector_field,
-        'attractors': attractors,
-    }
-    
-    output_file = Path('phase_space_analysis.json')
-    with output_file.open('w') as f:
-        json.dump(output, f, indent=2)
+        # Save results
+        output.member('vector_field', vector_field)
+        output.member('attractors', attractors)
+        output.close()
     
     print(f"\n{'=' * 70}")
     print(f"Full analysis saved to: {output_file}")
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from core.awareness.field import AwarenessField
 from core.awareness.recursion import AwarenessRecursion
 from core.awareness.dynamics import AwarenessDynamics
@@ -13,6 +14,7 @@ from core.audit.continuity import Continuity
 from core.knowledge.memory import Memory
 from core.knowledge.lineage import Lineage
 from core.knowledge.feedback import Feedback
+from core.knowledge.pipeline import MemoryPipeline
 from core.llm.config import LLMConfig
 from core.llm.adapter import LLMAdapter
 
@@ -34,6 +36,7 @@ async def run():
     memory = Memory()
     lineage = Lineage()
     feedback = Feedback()
+    knowledge = MemoryPipeline(memory, feedback, lineage)
 
     history = []
 
@@ -48,10 +51,13 @@ async def run():
     print(f"LLM: {llm_config}")
     print("=" * 60)
 
-    for i, input_state in enumerate(scenarios):
+    def begin_cycle(input_state):
+        # Everything up to the agent call depends only on earlier awareness
+        # states, never on agent output, so it can run ahead of the LLM.
+        now = time.time()
         depth = len(history)
 
-        awareness = field.generate(input_state, memory.state)
+        awareness = field.generate(input_state, memory.state, now)
         awareness = recursion.reflect(awareness, history)
         awareness = dynamics.regulate(awareness, memory.state)
 
@@ -60,46 +66,70 @@ async def run():
 
         invariants.register_spawn()
         agent = generator.spawn(awareness)
-        output = await agent.act(input_state)
 
-        explanation = explainability.explain_decision(awareness, output)
-        audit = auditor.evaluate(output, awareness)
-        alternatives = counterfactual.explore(awareness)
-
-        memory.update(awareness)
-        lineage.track(memory.state)
-        feedback.apply(memory.state, awareness)
+        knowledge.step(awareness, now)
 
         history.append(awareness)
+        continuity.update(awareness)
+
+        report = {
+            "continuity": continuity.assess(),
+            "memory_depth": memory.depth(),
+            "lineage_length": lineage.length(),
+            "feedback_positive": feedback.is_positive(memory.state),
+        }
+        return awareness, agent, report
+
+    def end_cycle(i, awareness, agent, output, report):
+        explanation = explainability.explain_decision(awareness, output, awareness.timestamp)
+        audit = auditor.evaluate(output, awareness)
+        alternatives = counterfactual.explore(awareness)
 
         residue = dissolution.dissolve(agent)
         invariants.register_dissolution()
 
-        cont = continuity.assess(history)
-
         print(f"\n--- Cycle {i + 1} ---")
-        print(f"  Field: {awareness.field}")
+        print(f"  Field: {dict(awareness.field)}")
         print(f"  Coherence: {awareness.coherence}")
         print(f"  Uncertainty: {awareness.uncertainty}")
         print(f"  Audit: {audit}")
-        print(f"  Continuity: {cont}")
+        print(f"  Continuity: {report['continuity']}")
         print(f"  Counterfactual scenarios: {list(alternatives.keys())}")
-        print(f"  Dissolved residue coherence: {residue['final_coherence']}")
-        print(f"  Memory depth: {memory.depth()}")
-        print(f"  Lineage length: {lineage.length()}")
-        print(f"  Feedback positive: {feedback.is_positive(memory.state)}")
-
-    print(f"\n{'=' * 60}")
-    print("CONTINUUM REPORT")
-    print(f"{'=' * 60}")
-    print(f"  Total cycles: {len(history)}")
-    print(f"  Audit summary: {auditor.summary()}")
-    print(f"  Continuity: {continuity.assess(history)}")
-    print(f"  Coherence lineage: {lineage.coherence_history()}")
-    print(f"  Agents spawned: {generator.spawn_count()}")
-    print(f"  Agents dissolved: {dissolution.total_dissolved()}")
-    print(f"  Invariant status: {invariants.status}")
-    print(f"  Explainability trace count: {len(explainability.full_trace())}")
+        print(f"  Dissolved residue coherence: {residue.final_coherence}")
+        print(f"  Memory depth: {report['memory_depth']}")
+        print(f"  Lineage length: {report['lineage_length']}")
+        print(f"  Feedback positive: {report['feedback_positive']}")
+
+    # LLM calls are independent I/O, so each batch of agents acts
+    # concurrently; batches stay within the invariant population cap.
+    # Deterministic mode keeps one cycle per batch.
+    batch_size = Invariants.MAX_AGENTS if llm.enabled else 1
+
+    try:
+        for start in range(0, len(scenarios), batch_size):
+            batch = scenarios[start:start + batch_size]
+            cycles = [begin_cycle(input_state) for input_state in batch]
+            outputs = await asyncio.gather(*(
+                agent.act(input_state)
+                for input_state, (_, agent, _) in zip(batch, cycles)
+            ))
+
+            for offset, ((awareness, agent, report), output) in enumerate(zip(cycles, outputs)):
+                end_cycle(start + offset, awareness, agent, output, report)
+
+        print(f"\n{'=' * 60}")
+        print("CONTINUUM REPORT")
+        print(f"{'=' * 60}")
+        print(f"  Total cycles: {len(history)}")
+        print(f"  Audit summary: {auditor.summary()}")
+        print(f"  Continuity: {continuity.assess()}")
+        print(f"  Coherence lineage: {lineage.coherence_history()}")
+        print(f"  Agents spawned: {generator.spawn_count()}")
+        print(f"  Agents dissolved: {dissolution.total_dissolved()}")
+        print(f"  Invariant status: {invariants.status}")
+        print(f"  Explainability trace count: {len(explainability.full_trace())}")
+    finally:
+        await llm.aclose()
 
 if __name__ == "__main__":
     asyncio.run(run())
\ No newline at end of file